@@ -0,0 +1,107 @@
+"""
+FCDN carrier index benchmark
+Loads CarrierPositionIndex with 20k synthetic carriers, either spread across the
+galaxy or mostly around the Bubble, checks nearest and range queries against
+brute force, and fails if the slowest query goes over budget.
+
+Uses the same EDMC stand-ins as bench_startup.py when run outside EDMC:
+
+    python bench_carrier_index.py
+"""
+
+import gc
+import math
+import random
+import statistics
+import sys
+import time
+
+from bench_startup import SETUP
+
+# Budget in milliseconds for a single query, checked against the slowest one
+QUERY_BUDGET_MS = 1.0
+
+CARRIERS = 20000
+QUERIES = 200
+# Each query is timed best-of-REPEATS, like timeit, so scheduler noise doesn't count against it
+REPEATS = 5
+K = 10
+# A jump-range sized radius; the Bubble core has a few hundred carriers inside it
+RADIUS = 50.0
+
+SOL = (0.0, 0.0, 0.0)
+COLONIA = (-9530.5, -910.28, 19808.125)
+
+
+def galaxy_point(rng: random.Random) -> tuple:
+    return rng.uniform(-42000, 42000), rng.uniform(-2000, 2000), rng.uniform(-22000, 68000)
+
+
+def bubble_point(rng: random.Random) -> tuple:
+    return rng.gauss(0, 150), rng.gauss(0, 60), rng.gauss(0, 150)
+
+
+def scenarios(rng: random.Random) -> dict:
+    spread = [galaxy_point(rng) for _ in range(CARRIERS)]
+    bubble = [bubble_point(rng) if rng.random() < 0.7 else galaxy_point(rng) for _ in range(CARRIERS)]
+    return {"spread across the galaxy": spread, "70% around the Bubble": bubble}
+
+
+def best_of(query, *args) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        query(*args)
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+def time_queries(index, queries: list) -> list:
+    gc.disable()
+    try:
+        return [best_of(query, q, arg) for q in queries for query, arg in ((index.nearest, K), (index.within, RADIUS))]
+    finally:
+        gc.enable()
+
+
+def check(index, points: list, queries: list) -> None:
+    for q in queries[:20]:
+        expected = sorted(math.dist(q, p) for p in points)[:K]
+        got = [d for d, _, _ in index.nearest(q, K)]
+        assert [round(d, 6) for d in got] == [round(d, 6) for d in expected], "nearest disagrees with brute force"
+        expected_within = sum(1 for p in points if math.dist(q, p) <= RADIUS)
+        assert len(index.within(q, RADIUS)) == expected_within, "within disagrees with brute force"
+
+
+def main() -> int:
+    exec(SETUP, {})
+    import load
+
+    rng = random.Random(27)
+    failed = False
+    for name, points in scenarios(rng).items():
+        index = load.CarrierPositionIndex()
+        for i, p in enumerate(points):
+            index.update(f"C{i:05d}", f"S{i}", p)
+        # some carriers jump after the last rebuild, so queries also see pending moves
+        for i in rng.sample(range(CARRIERS), 100):
+            points[i] = galaxy_point(rng)
+            index.update(f"C{i:05d}", f"S{i}", points[i])
+        queries = [SOL, COLONIA] + [galaxy_point(rng) for _ in range(QUERIES // 2)] \
+            + [rng.choice(points) for _ in range(QUERIES // 2)]
+        check(index, points, queries)
+        timings = time_queries(index, queries)
+        worst = max(timings)
+        print(f"{name}: median {statistics.median(timings):.3f} ms, worst {worst:.3f} ms "
+              f"(budget {QUERY_BUDGET_MS} ms)")
+        for label, q in (("Sol", SOL), ("Colonia", COLONIA)):
+            nearest, within = time_queries(index, [q])
+            print(f"  {label}: nearest {nearest:.3f} ms, within {within:.3f} ms")
+        if worst > QUERY_BUDGET_MS:
+            print(f"FAIL: {name} query over budget")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
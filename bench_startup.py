@@ -0,0 +1,99 @@
+"""
+FCDN startup benchmark
+Measures how long importing load.py and running plugin_start3 take, and fails
+if either goes over budget or pulls a heavy module onto EDMC's startup path.
+
+Run from an EDMC source checkout (so config and myNotebook import), or on its
+own, in which case the stand-ins for those two EDMC modules in tests/stubs are used:
+
+    python bench_startup.py
+"""
+
+import os
+import py_compile
+import re
+import subprocess
+import sys
+import time
+
+# Budgets in milliseconds for the plugin's own work, excluding tkinter
+IMPORT_BUDGET_MS = 10.0
+START_BUDGET_MS = 5.0
+
+# Must not be imported until first use
+LAZY_MODULES = ("requests", "webbrowser", "sqlite3", "numpy")
+
+RUNS = 5
+
+PLUGIN_DIR = os.path.dirname(os.path.abspath(__file__))
+# Stand-ins for EDMC's config and myNotebook, shared with the test suite
+STUBS_DIR = os.path.join(PLUGIN_DIR, "tests", "stubs")
+
+SETUP = f"""
+import sys
+sys.path.insert(0, {PLUGIN_DIR!r})
+# EDMC has these loaded before any plugin, so they are not the plugin's cost
+import tkinter, logging, pathlib, typing, datetime, json, threading
+try:
+    import config, myNotebook
+except ImportError:
+    sys.path.insert(0, {STUBS_DIR!r})
+    import config, myNotebook
+"""
+
+
+def measure_import() -> float:
+    """Cumulative import time of load.py in microseconds, from -X importtime"""
+    code = SETUP + "import load\n"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, check=True, cwd=PLUGIN_DIR,
+    )
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+\s+\|\s+(\d+)\s+\|\s*load$", line)
+        if match:
+            return int(match.group(1))
+    raise RuntimeError("load.py did not show up in -X importtime output")
+
+
+def measure_start() -> tuple[float, list]:
+    """plugin_start3 wall time in microseconds, and heavy modules loaded by import or start"""
+    exec(SETUP, {})
+    preloaded = set(sys.modules)
+    import load
+
+    # time only what EDMC waits for; the deferred thread's disk and network work is not on its path
+    load.deferred_start = lambda: None
+    started = time.perf_counter()
+    load.plugin_start3(PLUGIN_DIR)
+    elapsed = (time.perf_counter() - started) * 1e6
+
+    loaded = [name for name in LAZY_MODULES if name in sys.modules and name not in preloaded]
+    load.follow_up_scheduler.stop()
+    return elapsed, loaded
+
+
+def main() -> int:
+    # EDMC imports plugins from cached bytecode, so don't time compiling the source
+    py_compile.compile(os.path.join(PLUGIN_DIR, "load.py"), doraise=True)
+    import_us = min(measure_import() for _ in range(RUNS))
+    start_us, loaded = measure_start()
+
+    print(f"import load.py:  {import_us / 1000:7.2f} ms (budget {IMPORT_BUDGET_MS} ms)")
+    print(f"plugin_start3:   {start_us / 1000:7.2f} ms (budget {START_BUDGET_MS} ms)")
+
+    failed = False
+    if import_us / 1000 > IMPORT_BUDGET_MS:
+        print("FAIL: import time over budget")
+        failed = True
+    if start_us / 1000 > START_BUDGET_MS:
+        print("FAIL: plugin_start3 over budget")
+        failed = True
+    if loaded:
+        print(f"FAIL: heavy modules imported during startup: {', '.join(loaded)}")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,11 +6,20 @@ Posts fleet carrier jump events to Discord via webhook.
 import tkinter as tk
 from pathlib import Path
 from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
-import requests
+from datetime import datetime, timedelta, timezone
+import importlib
+import importlib.util
 import math
 import logging
 import os
+import json
+import time
+import heapq
+import itertools
+import operator
+import threading
+import queue
+from collections import deque
 # lru_cache to avoid repeated EDSM lookups
 from functools import lru_cache  
 
@@ -21,6 +30,27 @@ try:
 except ImportError:
     from edmc_mocks import *
 
+
+class _LazyModule:
+    """
+    Stands in for a heavy module and imports it on first attribute access,
+    keeping it off EDMC's startup path.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr: str):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+requests = _LazyModule("requests")
+webbrowser = _LazyModule("webbrowser")
+sqlite3 = _LazyModule("sqlite3")
+
 # Set up logging
 plugin_name = Path(__file__).resolve().parent.name
 logger = logging.getLogger(f'{appname}.{plugin_name}')
@@ -36,6 +66,96 @@ if not logger.hasHandlers():
     logger_channel.setFormatter(logger_formatter)
     logger.addHandler(logger_channel)
 
+# Per-template log rate limit: at most LOG_RATE_BURST records every LOG_RATE_INTERVAL seconds
+LOG_RATE_INTERVAL = 60.0
+LOG_RATE_BURST = 5
+# Number of recent events kept for diagnostics
+FLIGHT_RECORDER_SIZE = 500
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Lets each message template through at most `burst` times per `interval`.
+    Keyed on the unformatted template, so dropped records are never formatted.
+    """
+
+    def __init__(self, interval: float = LOG_RATE_INTERVAL, burst: int = LOG_RATE_BURST, clock=time.monotonic):
+        super().__init__()
+        self.interval = interval
+        self.burst = burst
+        self._clock = clock
+        self._windows = {}  # (level, template) -> [window start, passed, suppressed]
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = (record.levelno, record.msg)
+        now = self._clock()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.interval:
+                suppressed = window[2] if window else 0
+                self._windows[key] = [now, 1, 0]
+            elif window[1] < self.burst:
+                window[1] += 1
+                return True
+            else:
+                window[2] += 1
+                return False
+        if suppressed:
+            record.msg = f"{record.getMessage()} [{suppressed} similar suppressed]"
+            record.args = ()
+        return True
+
+
+class FlightRecorder:
+    """
+    Ring buffer of the last N plugin events and webhook deliveries. Fields are
+    stored as-is and only formatted when dumped.
+    """
+
+    def __init__(self, size: int = FLIGHT_RECORDER_SIZE, clock=time.time):
+        self._events = deque(maxlen=size)
+        self._clock = clock
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def record(self, event: str, **fields) -> None:
+        self._events.append((self._clock(), event, fields))
+
+    def events(self) -> list:
+        return list(self._events)
+
+    def dump(self) -> str:
+        lines = []
+        for ts, event, fields in self.events():
+            stamp = datetime.fromtimestamp(ts, timezone.utc).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+            detail = " ".join(f"{key}={value!r}" for key, value in fields.items())
+            lines.append(f"{stamp} {event} {detail}".rstrip())
+        return "\n".join(lines)
+
+
+class _EventFields:
+    # formats an event's fields only if a handler actually emits the record
+    __slots__ = ("fields",)
+
+    def __init__(self, fields: Dict[str, Any]):
+        self.fields = fields
+
+    def __str__(self) -> str:
+        return " ".join(f"{key}={value!r}" for key, value in self.fields.items())
+
+
+logger.addFilter(RateLimitFilter())
+flight_recorder = FlightRecorder()
+
+
+def log_event(event: str, /, *, level: int = logging.DEBUG, **fields) -> None:
+    """Record a structured event, and log it if `level` is enabled"""
+    flight_recorder.record(event, **fields)
+    if logger.isEnabledFor(level):
+        logger.log(level, event + ": %s", _EventFields(fields), stacklevel=2)
+
 # Configuration keys
 CONFIG_WEBHOOK = "fcms_discord_webhook"
 CONFIG_CARRIER_NAME = "fcms_carrier_name"
@@ -46,6 +166,13 @@ CONFIG_SHOW_USAGE = "fcms_show_usage"
 CONFIG_SHOW_REMAINING = "fcms_show_remaining"
 CONFIG_SHOW_TRITIUM_CANCEL = "fcms_show_tritium_cancel"
 CONFIG_SHOW_UI = "fcms_show_ui"
+CONFIG_FOLLOW_UPS = "fcms_follow_ups"
+CONFIG_FOLLOW_UP_TIMERS = "fcms_follow_up_timers"
+# only read to move older installs over to the history database
+CONFIG_CARRIER_POSITIONS = "fcms_carrier_positions"
+CONFIG_HISTORY_DIGEST = "fcms_history_digest"
+CONFIG_PENDING_JUMP = "fcms_pending_jump"
+CONFIG_DIGEST_DUE = "fcms_history_digest_due"
 
 showUI = False
 
@@ -63,7 +190,13 @@ class PluginConfig:
         self.show_remaining_var = None
         self.show_tritium_cancel_var = None
         self.show_ui_var = None  # Add this line
+        self.follow_ups_var = None
+        self.history_digest_var = None
+        self.history_label = None
+        self.history_button = None
         self.latest_version = None  # Store the latest version from GitHub
+        self.plugin_dir = None
+        self.diagnostics_label = None
 
 
 config_state = PluginConfig()
@@ -78,28 +211,78 @@ def is_valid_url(url: str) -> bool:
     return url.startswith(('http://', 'https://'))
 
 
+def deliver(webhook_url: str, payload: Dict[str, Any], kind: str, timeout: int = 10):
+    """POST a payload to the webhook, recording the outcome in the flight recorder"""
+    started = time.monotonic()
+    try:
+        response = requests.post(webhook_url, json=payload, timeout=timeout)
+    except Exception as e:
+        flight_recorder.record("delivery", kind=kind, ok=False, error=repr(e),
+                               ms=round((time.monotonic() - started) * 1000))
+        raise
+    flight_recorder.record("delivery", kind=kind, ok=response.status_code in (200, 204),
+                           status=response.status_code, ms=round((time.monotonic() - started) * 1000))
+    return response
+
+
 def plugin_start3(plugin_dir: str) -> str:
     logger.info("Plugin started")
+    config_state.plugin_dir = plugin_dir
+    jump_history.path = Path(plugin_dir) / HISTORY_FILE
     
     global showUI
     showUI = config.get_bool(CONFIG_SHOW_UI) if config.get_bool(CONFIG_SHOW_UI) is not None else False
-    logger.debug(f"Initialized showUI from config: {showUI}")
-    
-    # Check for latest version on plugin boot
+    logger.debug("Initialized showUI from config: %s", showUI)
+
+    # Everything that touches disk or network runs off EDMC's startup path
+    if config.get_bool(CONFIG_FOLLOW_UPS):
+        follow_up_scheduler.start()
+    threading.Thread(target=deferred_start, name="FCDN startup", daemon=True).start()
+
+    return "FCDN"
+
+
+_state_loaded = threading.Event()
+
+
+def deferred_start() -> None:
+    load_follow_ups()
+    load_carrier_positions()
+    load_pending_jump()
+    _state_loaded.set()
+    # saves are skipped until now, so write back whatever live events changed meanwhile
+    save_follow_ups()
+    save_carrier_positions(force=True)
+    save_pending_jump()
+    send_due_digest()
+    check_latest_version()
+
+
+def check_latest_version() -> None:
     try:
         response = requests.get("https://raw.githubusercontent.com/aweeri/FCDN/refs/heads/main/VERSION", timeout=5)
         if response.status_code == 200:
             config_state.latest_version = response.text.strip()
-            logger.info(f"Latest version available: {config_state.latest_version}")
+            logger.info("Latest version available: %s", config_state.latest_version)
         else:
-            logger.warning(f"Failed to fetch version file. Status code: {response.status_code}")
+            logger.warning("Failed to fetch version file. Status code: %s", response.status_code)
     except Exception as e:
-        logger.warning(f"Error checking for latest version: {e}")
-    
-    return "FCDN"
+        logger.warning("Error checking for latest version: %s", e)
 
 
 def plugin_stop() -> None:
+    follow_up_scheduler.stop()
+    # saving before the deferred load finished would wipe the persisted state
+    if _state_loaded.wait(timeout=2):
+        save_follow_ups()
+        save_carrier_positions(force=True)
+        # a jump that departed while nothing else was logged still happened
+        if _pending_jump and time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()) >= _pending_jump["departure_at"]:
+            # don't hold up EDMC's shutdown on a webhook, the digest goes out next start
+            commit_jump(dict(_pending_jump), post_digest=False)
+            _pending_jump.clear()
+        save_pending_jump()
+    jump_history.close()
     logger.info("Plugin stopped")
 
 
@@ -131,8 +314,14 @@ def plugin_app(parent: tk.Frame) -> Optional[tk.Frame]:
         buy_button = tk.Button(button_frame, text="Buying", command=fcdn_buy_action, width=10)
         buy_button.pack(side="left", padx=5, expand=True)
     
+        carriers_button = tk.Button(button_frame, text="Carriers", command=fcdn_carrier_summary_action, width=10)
+        carriers_button.pack(side="left", padx=5, expand=True)
+    
+        digest_button = tk.Button(button_frame, text="Digest", command=fcdn_digest_action, width=10)
+        digest_button.pack(side="left", padx=5, expand=True)
+    
         # Add some informational text
-        info_label = tk.Label(market_frame, text="Announce market operations to Discord", font=("", 8), fg="gray")
+        info_label = tk.Label(market_frame, text="Announce market operations and carrier positions to Discord", font=("", 8), fg="gray")
         info_label.pack(pady=(0, 5))
     
     return frame
@@ -245,11 +434,44 @@ def plugin_prefs(parent: nb.Notebook, cmdr: str, is_beta: bool) -> Optional[tk.F
     config_state.show_ui_checkbox.grid(row=current_row, column=0, columnspan=2, padx=10, pady=(10, 5), sticky=tk.W)
     
     current_row += 1
+
+    # Follow-up notifications checkbox
+    follow_ups_default = config.get_bool(CONFIG_FOLLOW_UPS) if config.get_bool(CONFIG_FOLLOW_UPS) is not None else False
+    config_state.follow_ups_var = tk.BooleanVar(value=follow_ups_default)
+    config_state.follow_ups_checkbox = nb.Checkbutton(frame, text="Send lockdown, jump and arrival follow-ups", variable=config_state.follow_ups_var)
+    config_state.follow_ups_checkbox.grid(row=current_row, column=0, columnspan=2, padx=10, pady=(10, 5), sticky=tk.W)
+
+    current_row += 1
+
+    # Weekly jump digest checkbox
+    history_digest_default = config.get_bool(CONFIG_HISTORY_DIGEST) if config.get_bool(CONFIG_HISTORY_DIGEST) is not None else False
+    config_state.history_digest_var = tk.BooleanVar(value=history_digest_default)
+    config_state.history_digest_checkbox = nb.Checkbutton(frame, text="Post weekly jump digest", variable=config_state.history_digest_var)
+    config_state.history_digest_checkbox.grid(row=current_row, column=0, columnspan=2, padx=10, pady=(10, 5), sticky=tk.W)
+
+    current_row += 1
+
+    history_frame = nb.Frame(frame)
+    history_frame.grid(row=current_row, column=0, columnspan=2, padx=10, pady=(0, 5), sticky=tk.W)
+    config_state.history_button = nb.Button(history_frame, text="Import Journal History", command=start_history_backfill)
+    config_state.history_button.grid(row=0, column=0, padx=5)
+    config_state.history_label = nb.Label(history_frame, text="Builds jump history from old journal files")
+    config_state.history_label.grid(row=0, column=1, padx=5, sticky=tk.W)
+    # an import started before the window was last closed, or finished while it was
+    if _backfill_running.is_set():
+        set_backfill_status("Importing journal history...", busy=True)
+    if _backfill_running.is_set() or not _backfill_results.empty():
+        poll_backfill()
+
+    current_row += 1
     
     test_frame = nb.Frame(frame)
     test_frame.grid(row=current_row, column=0, columnspan=2, padx=10, pady=10, sticky=tk.W)
     
     nb.Button(test_frame, text="Test Webhook", command=test_webhook).grid(row=0, column=0, padx=5)
+    nb.Button(test_frame, text="Save Diagnostics", command=save_diagnostics).grid(row=0, column=1, padx=5)
+    config_state.diagnostics_label = nb.Label(test_frame, text=f"{len(flight_recorder)} recent events recorded")
+    config_state.diagnostics_label.grid(row=0, column=2, padx=5, sticky=tk.W)
     
     # Version information at the end of settings
     current_row += 1
@@ -267,7 +489,6 @@ def plugin_prefs(parent: nb.Notebook, cmdr: str, is_beta: bool) -> Optional[tk.F
         latest_label.grid(row=1, column=0, sticky=tk.W)
         
         def open_github(event):
-            import webbrowser
             webbrowser.open("https://github.com/aweeri/FCDN")
         
         latest_label.bind("<Button-1>", open_github)
@@ -289,42 +510,320 @@ def prefs_changed(cmdr: str, is_beta: bool) -> None:
     
     if config_state.fuel_mode_var is not None:
         config.set(CONFIG_FUEL_MODE, config_state.fuel_mode_var.get())
-        logger.debug(f"Integration mode set to: {config_state.fuel_mode_var.get()}")  # CHANGE
+        logger.debug("Integration mode set to: %s", config_state.fuel_mode_var.get())  # CHANGE
     
     if config_state.show_distance_var is not None:
         config.set(CONFIG_SHOW_DISTANCE, config_state.show_distance_var.get())
-        logger.debug(f"Show distance set to: {config_state.show_distance_var.get()}")
+        logger.debug("Show distance set to: %s", config_state.show_distance_var.get())
     if config_state.show_usage_var is not None:
         config.set(CONFIG_SHOW_USAGE, config_state.show_usage_var.get())
-        logger.debug(f"Show usage set to: {config_state.show_usage_var.get()}")
+        logger.debug("Show usage set to: %s", config_state.show_usage_var.get())
     if config_state.show_remaining_var is not None:
         config.set(CONFIG_SHOW_REMAINING, config_state.show_remaining_var.get())
-        logger.debug(f"Show remaining set to: {config_state.show_remaining_var.get()}")
+        logger.debug("Show remaining set to: %s", config_state.show_remaining_var.get())
     if config_state.show_tritium_cancel_var is not None:
         config.set(CONFIG_SHOW_TRITIUM_CANCEL, config_state.show_tritium_cancel_var.get())
-        logger.debug(f"Show tritium on cancel set to: {config_state.show_tritium_cancel_var.get()}")
+        logger.debug("Show tritium on cancel set to: %s", config_state.show_tritium_cancel_var.get())
     if config_state.show_ui_var is not None:
         config.set(CONFIG_SHOW_UI, config_state.show_ui_var.get())
         global showUI
         showUI = config_state.show_ui_var.get()
-        logger.debug(f"Show UI set to: {showUI}")
+        logger.debug("Show UI set to: %s", showUI)
+    if config_state.follow_ups_var is not None:
+        config.set(CONFIG_FOLLOW_UPS, config_state.follow_ups_var.get())
+        logger.debug("Follow-ups set to: %s", config_state.follow_ups_var.get())
+        if config_state.follow_ups_var.get():
+            follow_up_scheduler.start()
+        else:
+            follow_up_scheduler.stop()
+            follow_up_scheduler.clear()
+            save_follow_ups()
+    if config_state.history_digest_var is not None:
+        config.set(CONFIG_HISTORY_DIGEST, config_state.history_digest_var.get())
+        logger.debug("History digest set to: %s", config_state.history_digest_var.get())
 
 
 
 
 
+LOCKDOWN_LEAD = timedelta(minutes=3, seconds=20)
+
+
 def calculate_times(departure_time: str) -> tuple:
     try:
         departure_dt = datetime.fromisoformat(departure_time.replace('Z', '+00:00'))
-        lockdown_dt = departure_dt - timedelta(minutes=3, seconds=20)
-        
+        lockdown_dt = departure_dt - LOCKDOWN_LEAD
+
         lockdown_str = f"<t:{int(lockdown_dt.timestamp())}:R>"
         jump_str = f"<t:{int(departure_dt.timestamp())}:R>"
         return lockdown_str, jump_str
     except Exception as e:
-        logger.warning(f"Failed to parse departure time: {e}")
+        logger.warning("Failed to parse departure time: %s", e)
         return "<t:0:R>", "<t:0:R>"
-    
+
+
+# Follow-up notification kinds
+FOLLOW_UP_LOCKDOWN = "lockdown"
+FOLLOW_UP_JUMP = "jump"
+FOLLOW_UP_ARRIVED = "arrived"
+
+# restored timers older than this (seconds) went stale while EDMC was closed
+FOLLOW_UP_RESTORE_GRACE = 60
+
+
+class FollowUpScheduler:
+    """
+    Runs every pending follow-up timer from a single thread off a heap.
+    Each carrier owns a generation token; cancelling just drops the token and
+    the orphaned heap entries are skipped when they surface.
+    """
+
+    def __init__(self, callback, clock=time.time):
+        self._callback = callback
+        self._clock = clock
+        self._heap = []
+        self._jobs = {}  # carrier -> [token, timers still pending]
+        self._touched = set()  # carriers scheduled or cancelled since startup, restore leaves them alone
+        self._stale = 0
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread = None
+        self._running = False
+
+    def __len__(self) -> int:
+        with self._cond:
+            return sum(job[1] for job in self._jobs.values())
+
+    def schedule(self, carrier: str, timers) -> None:
+        """Replace a carrier's pending timers with (kind, due, data) tuples"""
+        with self._cond:
+            self._touched.add(carrier)
+            self._drop(carrier)
+            token = next(self._seq)
+            count = 0
+            for kind, due, data in timers:
+                heapq.heappush(self._heap, (due, next(self._seq), carrier, token, kind, data))
+                count += 1
+            if count:
+                self._jobs[carrier] = [token, count]
+            self._cond.notify()
+
+    def cancel(self, carrier: str) -> bool:
+        with self._cond:
+            self._touched.add(carrier)
+            cancelled = self._drop(carrier)
+            self._cond.notify()
+            return cancelled
+
+    def clear(self) -> None:
+        with self._cond:
+            self._heap.clear()
+            self._jobs.clear()
+            self._stale = 0
+            self._cond.notify()
+
+    def pending(self, carrier: str) -> list:
+        with self._cond:
+            job = self._jobs.get(carrier)
+            if not job:
+                return []
+            return sorted((due, kind) for due, _, c, token, kind, _ in self._heap
+                          if c == carrier and token == job[0])
+
+    def run_due(self, now: float | None = None) -> int:
+        """Fire every timer due at `now` (defaults to the clock). Returns how many fired"""
+        now = self._clock() if now is None else now
+        due = []
+        with self._cond:
+            while self._heap and self._heap[0][0] <= now:
+                _, _, carrier, token, kind, data = heapq.heappop(self._heap)
+                job = self._jobs.get(carrier)
+                if not job or job[0] != token:
+                    self._stale -= 1
+                    continue
+                job[1] -= 1
+                if not job[1]:
+                    del self._jobs[carrier]
+                due.append((carrier, kind, data))
+
+        for carrier, kind, data in due:
+            try:
+                self._callback(carrier, kind, data)
+            except Exception as e:
+                logger.error("Follow-up %s for %s failed: %s", kind, carrier, e)
+        return len(due)
+
+    def snapshot(self) -> list:
+        """Pending timers as JSON-friendly dicts, soonest first"""
+        with self._cond:
+            live = [(due, seq, carrier, kind, data) for due, seq, carrier, token, kind, data in self._heap
+                    if carrier in self._jobs and self._jobs[carrier][0] == token]
+        return [{"carrier": carrier, "kind": kind, "due": due, "data": data}
+                for due, _, carrier, kind, data in sorted(live)]
+
+    def restore(self, items, now: float | None = None) -> int:
+        """Reschedule timers from snapshot(), dropping ones that went stale. Returns how many were kept"""
+        now = self._clock() if now is None else now
+        grouped = {}
+        for item in items:
+            try:
+                due = float(item["due"])
+                if due < now - FOLLOW_UP_RESTORE_GRACE:
+                    continue
+                grouped.setdefault(item["carrier"], []).append((item["kind"], due, item.get("data") or {}))
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning("Skipping malformed follow-up timer %r: %s", item, e)
+        kept = 0
+        with self._cond:
+            for carrier, timers in grouped.items():
+                # a jump, cancel or arrival seen since startup is newer than anything persisted
+                if carrier in self._touched:
+                    continue
+                self.schedule(carrier, timers)
+                kept += len(timers)
+        return kept
+
+    def start(self) -> None:
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name="FCDN follow-ups", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _drop(self, carrier: str) -> bool:
+        # caller holds the lock; orphaned heap entries are compacted once they dominate
+        job = self._jobs.pop(carrier, None)
+        if not job:
+            return False
+        self._stale += job[1]
+        if self._stale > 64 and self._stale * 2 > len(self._heap):
+            self._heap = [e for e in self._heap if e[2] in self._jobs and self._jobs[e[2]][0] == e[3]]
+            heapq.heapify(self._heap)
+            self._stale = 0
+        return True
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._running:
+                    return
+                delay = self._heap[0][0] - self._clock() if self._heap else None
+                if delay is None or delay > 0:
+                    self._cond.wait(delay)
+                    continue
+            self.run_due()
+
+
+def follow_up_timers(departure_time: str, data: Dict[str, Any], now: float | None = None) -> list:
+    """Lockdown and jump timers for a CarrierJumpRequest, skipping any already past"""
+    try:
+        departure_dt = datetime.fromisoformat(departure_time.replace('Z', '+00:00'))
+    except Exception as e:
+        logger.warning("Failed to parse departure time for follow-ups: %s", e)
+        return []
+    now = time.time() if now is None else now
+    timers = [
+        (FOLLOW_UP_LOCKDOWN, (departure_dt - LOCKDOWN_LEAD).timestamp(), data),
+        (FOLLOW_UP_JUMP, departure_dt.timestamp(), data),
+    ]
+    return [t for t in timers if t[1] > now]
+
+
+def create_follow_up_embed(kind: str, carrier_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    destination = data.get("destination") or "Unknown"
+    embed = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "footer": {"text": f"EDMC FCDN • CMDR {data.get('cmdr', '')}"},
+    }
+
+    if kind == FOLLOW_UP_LOCKDOWN:
+        embed.update({
+            "title": "Lockdown Now",
+            "description": f"**{carrier_name}** is locking down. Get off the pads or stay aboard.",
+            "color": 0xf1c40f,
+            "fields": [{"name": "Headed to", "value": f"```{destination}```", "inline": False}],
+        })
+    elif kind == FOLLOW_UP_JUMP:
+        embed.update({
+            "title": "Jumping Now",
+            "description": f"**{carrier_name}** is jumping.",
+            "color": 0x9b59b6,
+            "fields": [{"name": "Headed to", "value": f"```{destination}```", "inline": False}],
+        })
+    elif kind == FOLLOW_UP_ARRIVED:
+        fields = [{"name": "Arrived at", "value": f"```{destination}```", "inline": False}]
+        if data.get("body") and data.get("body") != destination:
+            fields.append({"name": "Body", "value": f"```{data['body']}```", "inline": False})
+        embed.update({
+            "title": "Jump Complete",
+            "description": f"**{carrier_name}** has arrived.",
+            "color": 0x2ecc71,
+            "fields": fields,
+        })
+
+    image_url = config.get_str(CONFIG_IMAGE_URL) or ""
+    if is_valid_url(image_url):
+        embed["thumbnail"] = {"url": image_url.strip()}
+    return embed
+
+
+def follow_up_key(carrier_id) -> str:
+    """Scheduler key for a carrier, the same whether scheduling, cancelling or arriving"""
+    return carrier_id or "Unknown"
+
+
+def send_follow_up(carrier: str, kind: str, data: Dict[str, Any]) -> bool:
+    """Post a follow-up embed, called from the scheduler thread and on CarrierJump"""
+    webhook_url = config.get_str(CONFIG_WEBHOOK) or ""
+    if not webhook_url.startswith(
+        ("https://discord.com/api/webhooks/", "https://discordapp.com/api/webhooks/")
+    ):
+        logger.warning("Webhook URL not configured or invalid, dropping follow-up")
+        return False
+
+    log_event("follow_up", carrier=carrier, kind=kind)
+    carrier_name = f"{config.get_str(CONFIG_CARRIER_NAME) or ''} ({carrier})"
+    embed = create_follow_up_embed(kind, carrier_name, data)
+    try:
+        response = deliver(webhook_url, {"embeds": [embed]}, f"follow-up {kind}", timeout=30)
+        if response.status_code in [200, 204]:
+            logger.debug("Follow-up %s sent for %s", kind, carrier)
+            return True
+        logger.warning("Follow-up %s failed with status: %s", kind, response.status_code)
+    except Exception as e:
+        logger.error("Error sending follow-up %s: %s", kind, e)
+    return False
+
+
+follow_up_scheduler = FollowUpScheduler(send_follow_up)
+
+
+def save_follow_ups() -> None:
+    # until the deferred load ran this would overwrite the saved timers with a partial set
+    if not _state_loaded.is_set():
+        return
+    config.set(CONFIG_FOLLOW_UP_TIMERS, json.dumps(follow_up_scheduler.snapshot()))
+
+
+def load_follow_ups() -> None:
+    raw = config.get_str(CONFIG_FOLLOW_UP_TIMERS) or ""
+    if not raw or not config.get_bool(CONFIG_FOLLOW_UPS):
+        return
+    try:
+        kept = follow_up_scheduler.restore(json.loads(raw))
+        logger.debug("Restored %s pending follow-up timers", kept)
+    except ValueError as e:
+        logger.warning("Discarding unreadable follow-up timers: %s", e)
+
 
 # cache EDSM responses to reduce API load
 @lru_cache(maxsize=4096)
@@ -339,10 +838,10 @@ def edsm_coords(system_name: str):
         if isinstance(js, dict) and "coords" in js:
             c = js["coords"]
             return float(c["x"]), float(c["y"]), float(c["z"])
-        logger.debug(f"EDSM coordinates not found for system: {system_name}")
+        logger.debug("EDSM coordinates not found for system: %s", system_name)
         return None
     except Exception as e:
-        logger.warning(f"EDSM API error for {system_name}: {e}")
+        logger.warning("EDSM API error for %s: %s", system_name, e)
         return None
 
 
@@ -354,13 +853,24 @@ def ly_distance(a_name: str, b_name: str) -> float | None:
     (x1, y1, z1), (x2, y2, z2) = a, b
     return math.sqrt((x2-x1)**2 + (y2-y1)**2 + (z2-z1)**2)
 
-_carrier_state = {"fuel": 0, "used": 0, "id": "Unknown"}
+# "id" is the callsign; "number" is the journal's numeric CarrierID, which history is keyed on
+_carrier_state = {"fuel": 0, "used": 0, "id": "Unknown", "number": None}
 
 def update_carrier_state(entry: Dict[str, Any]) -> None:
     #Update carrier state cache from a CarrierStats event
     global _carrier_state
     _carrier_state["fuel"] = int(entry.get("FuelLevel") or 0)
+    _carrier_state["used"] = carrier_used_space(entry)
+
+    _carrier_state["id"] = entry.get("Callsign")
+    if entry.get("CarrierID"):
+        _carrier_state["number"] = str(entry["CarrierID"])
+    
+    logger.debug("Carrier state updated - fuel: %s, used: %s", _carrier_state['fuel'], _carrier_state['used'])
 
+
+def carrier_used_space(entry: Dict[str, Any]) -> int:
+    """Cargo space in use from a CarrierStats event"""
     space = entry.get("SpaceUsage") or {}
     used = space.get("UsedSpace")
     # UsedSpace is a bit fucked sometimes, back up option needed
@@ -368,18 +878,19 @@ def update_carrier_state(entry: Dict[str, Any]) -> None:
         total, free = space.get("TotalCapacity"), space.get("FreeSpace")
         if total is not None and free is not None:
             used = total - free
-    
-    _carrier_state["used"] = int(used or 0)
-
-    _carrier_state["id"] = entry.get("Callsign")
-    
-    logger.debug(f"Carrier state updated - fuel: {_carrier_state['fuel']}, used: {_carrier_state['used']}")
+    return int(used or 0)
 
 
 def get_carrier_state() -> tuple[int, int]:
     return _carrier_state["fuel"], _carrier_state["used"], _carrier_state["id"]
 
 
+def jump_fuel_cost(distance: float, fuel_level, used_space) -> int:
+    total_mass = (fuel_level or 0) + (used_space or 0)
+    # community formula for fuel cost: 5 + d*(25_000 + mass)/200_000, rounded up
+    return math.ceil(5 + distance * (25000 + total_mass) / 200000)
+
+
 # obey integration flag; never call EDSM when disabled
 def carrier_fuel_cost(start_system, end_system, fuel_level, used_space, integration_enabled: bool):
     if not integration_enabled:  
@@ -388,31 +899,26 @@ def carrier_fuel_cost(start_system, end_system, fuel_level, used_space, integrat
     jump_distance = ly_distance(start_system, end_system)
     
     if jump_distance is None:
-        logger.debug(f"Could not calculate distance between {start_system} and {end_system}")
+        logger.debug("Could not calculate distance between %s and %s", start_system, end_system)
         return None, None, fuel_level
     
     if jump_distance > 500:
-        logger.debug(f"Jump distance {jump_distance} ly exceeds 500 ly limit")
+        logger.debug("Jump distance %s ly exceeds 500 ly limit", jump_distance)
         return None, None, fuel_level
 
     # clamp distance incase something else is wrong
     d = max(0.0, min(500.0, float(jump_distance)))
-    total_mass = (fuel_level or 0) + (used_space or 0)
-
-    # community formula for fuel cost: 5 + d*(25_000 + mass)/200_000, rounded up
-    fuel_cost = math.ceil(5 + d * (25000 + total_mass) / 200000)
+    fuel_cost = jump_fuel_cost(d, fuel_level, used_space)
 
     remaining_fuel = max(0, (fuel_level or 0) - fuel_cost)
     
-    logger.debug(f"Fuel calculation: distance={d:.2f} ly, cost={fuel_cost} t, remaining={remaining_fuel} t")
+    logger.debug("Fuel calculation: distance=%.2f ly, cost=%s t, remaining=%s t", d, fuel_cost, remaining_fuel)
     return jump_distance, fuel_cost, remaining_fuel
 
 
 def is_player_on_their_carrier(state: Dict[str, Any], carrier_id) -> bool:
     station_name = state.get('StationName', '')
     
-    logger.debug(f"Carrier validation - Configured ID: '{carrier_id}', Station: '{station_name}'")
-    
     if not carrier_id:
         logger.warning("No carrier ID configured in settings")
         return False
@@ -428,15 +934,817 @@ def is_player_on_their_carrier(state: Dict[str, Any], carrier_id) -> bool:
     # Also check if station name contains the full carrier ID with dashes
     contains_id = (carrier_id_clean in station_clean) or (carrier_id.upper() in station_name.upper())
     
-    logger.debug(f"Carrier validation - Clean ID: '{carrier_id_clean}', Clean Station: '{station_clean}', Match: {contains_id}")
-    
-    if contains_id:
-        logger.info(f"Player confirmed on their carrier: {station_name} matches configured ID {carrier_id}")
+    # runs on every jump, so keep it a structured debug event rather than INFO/WARNING
+    log_event("carrier_check", carrier=carrier_id, station=station_name, match=contains_id)
+    return contains_id
+
+
+# Carriers per KD-tree leaf; small buckets keep the distance loops short
+CARRIER_KDTREE_LEAF = 16
+
+
+class CarrierPositionIndex:
+    """
+    Latest known position of every carrier seen, indexed by a KD-tree with
+    bucketed leaves. Moves land in a small delta buffer and make the carrier's
+    old tree entry stale; the tree is rebuilt once the buffer outgrows
+    sqrt(N), so updates stay cheap without letting queries scan a long buffer.
+    """
+
+    def __init__(self, leaf_size: int = CARRIER_KDTREE_LEAF):
+        self._leaf_size = leaf_size
+        self._positions = {}  # callsign -> (system, coords, timestamp)
+        self._tree = None
+        self._delta = {}  # callsign -> coords, carriers added or moved since the last rebuild
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def update(self, callsign: str, system: str, coords, timestamp: str = "") -> None:
+        with self._lock:
+            if self._set(callsign, system, coords, timestamp):
+                self._maybe_rebuild()
+
+    def _set(self, callsign: str, system: str, coords, timestamp: str) -> bool:
+        coords = tuple(float(c) for c in coords)
+        previous = self._positions.get(callsign)
+        if previous is not None and timestamp and previous[2] and timestamp < previous[2]:
+            # older than what we already know, e.g. restored after a live update
+            return False
+        if previous is not None and previous[1] == coords:
+            # same place, keep the tuple the tree already points at
+            coords = previous[1]
+        else:
+            self._delta[callsign] = coords
+        self._positions[callsign] = (system, coords, timestamp)
         return True
+
+    def remove(self, callsign: str) -> bool:
+        with self._lock:
+            if self._positions.pop(callsign, None) is None:
+                return False
+            self._delta.pop(callsign, None)
+            return True
+
+    def get(self, callsign: str):
+        return self._positions.get(callsign)
+
+    def _maybe_rebuild(self) -> None:
+        if len(self._delta) > max(32, math.isqrt(len(self._positions))):
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        points = [(coords[0], coords[1], coords[2], callsign, coords)
+                  for callsign, (_, coords, _) in self._positions.items()]
+        if points:
+            box = [(min(p[axis] for p in points), max(p[axis] for p in points)) for axis in range(3)]
+            self._tree = self._build(points, box)
+        else:
+            self._tree = None
+        self._delta.clear()
+
+    def _build(self, points: list, box: list):
+        # leaves are plain lists of (x, y, z, callsign, coords); inner nodes are (axis, split, low, high)
+        if len(points) <= self._leaf_size:
+            return points
+        # split the longest side of the cell, which keeps cells roughly cubic in the flat galaxy
+        axis = max(range(3), key=lambda a: box[a][1] - box[a][0])
+        points.sort(key=operator.itemgetter(axis))
+        middle = len(points) // 2
+        split = points[middle][axis]
+        low_box, high_box = list(box), list(box)
+        low_box[axis], high_box[axis] = (box[axis][0], split), (split, box[axis][1])
+        return axis, split, self._build(points[:middle], low_box), self._build(points[middle:], high_box)
+
+    def nearest(self, coords, k: int = 5) -> list:
+        """(distance, callsign, system) for the k carriers closest to coords, nearest first"""
+        if k <= 0:
+            return []
+        qx, qy, qz = (float(c) for c in coords)
+        query = (qx, qy, qz)
+        best = []  # max-heap of (-squared distance, callsign)
+
+        def consider(d2, callsign):
+            if len(best) < k:
+                heapq.heappush(best, (-d2, callsign))
+            elif -d2 > best[0][0]:
+                heapq.heapreplace(best, (-d2, callsign))
+
+        with self._lock:
+            positions = self._positions
+            for callsign, (x, y, z) in self._delta.items():
+                consider((x - qx) ** 2 + (y - qy) ** 2 + (z - qz) ** 2, callsign)
+            # (node, squared distance to its box, per-axis offsets making up that distance)
+            stack = [(self._tree, 0.0, (0.0, 0.0, 0.0))] if self._tree is not None else []
+            while stack:
+                node, bound, offsets = stack.pop()
+                if len(best) == k and bound >= -best[0][0]:
+                    continue
+                if isinstance(node, list):
+                    for x, y, z, callsign, point in node:
+                        d2 = (x - qx) ** 2 + (y - qy) ** 2 + (z - qz) ** 2
+                        if len(best) < k or -d2 > best[0][0]:
+                            # a tree entry is stale once the carrier moved or was removed
+                            position = positions.get(callsign)
+                            if position is not None and position[1] is point:
+                                consider(d2, callsign)
+                    continue
+                axis, split, low, high = node
+                gap = query[axis] - split
+                near, far = (low, high) if gap < 0 else (high, low)
+                # the far box is at least as far as the splitting plane, on top of the other axes' offsets
+                far_bound = bound - offsets[axis] ** 2 + gap * gap
+                if len(best) < k or far_bound < -best[0][0]:
+                    far_offsets = list(offsets)
+                    far_offsets[axis] = gap
+                    stack.append((far, far_bound, tuple(far_offsets)))
+                stack.append((near, bound, offsets))
+            found = sorted((-d2, callsign) for d2, callsign in best)
+            return [(math.sqrt(d2), callsign, positions[callsign][0]) for d2, callsign in found]
+
+    def within(self, coords, radius: float) -> list:
+        """(distance, callsign, system) for every carrier within radius ly, nearest first"""
+        qx, qy, qz = (float(c) for c in coords)
+        query = (qx, qy, qz)
+        limit = radius * radius
+        found = []
+        with self._lock:
+            positions = self._positions
+            for callsign, (x, y, z) in self._delta.items():
+                d2 = (x - qx) ** 2 + (y - qy) ** 2 + (z - qz) ** 2
+                if d2 <= limit:
+                    found.append((d2, callsign))
+            stack = [(self._tree, 0.0, (0.0, 0.0, 0.0))] if self._tree is not None else []
+            while stack:
+                node, bound, offsets = stack.pop()
+                if isinstance(node, list):
+                    for x, y, z, callsign, point in node:
+                        d2 = (x - qx) ** 2 + (y - qy) ** 2 + (z - qz) ** 2
+                        if d2 <= limit:
+                            position = positions.get(callsign)
+                            if position is not None and position[1] is point:
+                                found.append((d2, callsign))
+                    continue
+                axis, split, low, high = node
+                gap = query[axis] - split
+                near, far = (low, high) if gap < 0 else (high, low)
+                far_bound = bound - offsets[axis] ** 2 + gap * gap
+                if far_bound <= limit:
+                    far_offsets = list(offsets)
+                    far_offsets[axis] = gap
+                    stack.append((far, far_bound, tuple(far_offsets)))
+                stack.append((near, bound, offsets))
+            found.sort()
+            return [(math.sqrt(d2), callsign, positions[callsign][0]) for d2, callsign in found]
+
+    def snapshot(self) -> list:
+        with self._lock:
+            return [{"callsign": callsign, "system": system, "coords": list(coords), "timestamp": timestamp}
+                    for callsign, (system, coords, timestamp) in self._positions.items()]
+
+    def restore(self, items) -> int:
+        restored = 0
+        with self._lock:
+            for item in items:
+                try:
+                    self._set(item["callsign"], item["system"], item["coords"], item.get("timestamp", ""))
+                    restored += 1
+                except (KeyError, TypeError, ValueError) as e:
+                    logger.warning("Skipping malformed carrier position %r: %s", item, e)
+            # one rebuild for the whole batch
+            self._rebuild()
+        return restored
+
+
+carrier_positions = CarrierPositionIndex()
+
+# StarPos of systems seen in the journal, so positions rarely need EDSM
+_system_coords = {}
+_current_system = {"name": None, "coords": None}
+
+
+def system_coords(system_name: str):
+    """Coordinates from journal StarPos, falling back to EDSM when integration is enabled"""
+    if not system_name:
+        return None
+    coords = _system_coords.get(system_name)
+    if coords is None and config.get_bool(CONFIG_FUEL_MODE):
+        coords = edsm_coords(system_name)
+    return coords
+
+
+def nearest_carriers(system_name: str, k: int = 5) -> list:
+    coords = system_coords(system_name)
+    return carrier_positions.nearest(coords, k) if coords else []
+
+
+def carriers_within(system_name: str, radius: float) -> list:
+    coords = system_coords(system_name)
+    return carrier_positions.within(coords, radius) if coords else []
+
+
+# Requested jumps by callsign, as (system, coords, departure); only applied once departed
+_pending_positions = {}
+
+
+def track_carrier_positions(entry: Dict[str, Any], state: Dict[str, Any], carrier_id) -> list:
+    """Feed StarPos and carrier locations from a journal entry. Returns the callsigns that moved"""
+    event_type = entry.get("event")
+    timestamp = entry.get("timestamp") or ""
+    moved = []
+
+    # a request can still be cancelled, so the carrier only moves once its departure passed
+    for callsign, (system, coords, departure) in list(_pending_positions.items()):
+        if timestamp and timestamp >= departure:
+            del _pending_positions[callsign]
+            carrier_positions.update(callsign, system, coords, departure)
+            moved.append(callsign)
+
+    if event_type in ("FSDJump", "Location", "CarrierJump") and entry.get("StarPos"):
+        coords = tuple(float(c) for c in entry["StarPos"])
+        _system_coords[entry.get("StarSystem")] = coords
+        _current_system["name"], _current_system["coords"] = entry.get("StarSystem"), coords
+
+    if event_type in ("Docked", "CarrierJump", "Location") and entry.get("StationType") == "FleetCarrier":
+        coords = _system_coords.get(entry.get("StarSystem")) or state.get("StarPos")
+        if entry.get("StationName") and coords:
+            if event_type == "CarrierJump":
+                _pending_positions.pop(entry["StationName"], None)
+            carrier_positions.update(entry["StationName"], entry.get("StarSystem"), coords, timestamp)
+            moved.append(entry["StationName"])
+
+    elif event_type == "CarrierJumpRequest" and carrier_id and carrier_id != "Unknown":
+        # carrier_id stays "Unknown" until CarrierStats has been seen, don't file jumps under it
+        destination = entry.get("SystemName")
+        coords = system_coords(destination)
+        if coords and entry.get("DepartureTime"):
+            _pending_positions[carrier_id] = (destination, coords, entry["DepartureTime"])
+        else:
+            logger.debug("No coordinates for %s, carrier position not recorded", destination)
+
+    elif event_type == "CarrierJumpCancelled":
+        _pending_positions.pop(carrier_id, None)
+
+    return moved
+
+
+def jump_origin(state: Dict[str, Any], system: str, carrier_id):
+    """
+    Where a jump requested now starts, as (system, coords, timestamp), from confirmed
+    data only: the player's own system while aboard, else the carrier's last recorded position
+    """
+    if carrier_id and carrier_id != "Unknown" and system and is_player_on_their_carrier(state, carrier_id):
+        coords = _system_coords.get(system) or state.get("StarPos")
+        return system, tuple(coords) if coords else None, ""
+    return carrier_positions.get(carrier_id) if carrier_id else None
+
+
+# Moved carriers are written to the history database at most this often (seconds) and on stop
+CARRIER_POSITIONS_SAVE_INTERVAL = 300
+_positions_saved = {"dirty": set(), "at": 0.0}
+
+
+def save_carrier_positions(force: bool = False) -> None:
+    """Write the carriers that moved since the last save, one row each"""
+    if not _positions_saved["dirty"] or not _state_loaded.is_set():
+        return
+    now = time.monotonic()
+    if not force and now - _positions_saved["at"] < CARRIER_POSITIONS_SAVE_INTERVAL:
+        return
+    dirty, _positions_saved["dirty"] = _positions_saved["dirty"], set()
+    positions = []
+    for callsign in dirty:
+        position = carrier_positions.get(callsign)
+        if position:
+            system, coords, timestamp = position
+            positions.append({"callsign": callsign, "system": system, "coords": coords, "timestamp": timestamp})
+    try:
+        jump_history.save_positions(positions)
+    except Exception as e:
+        logger.error("Failed to save carrier positions: %s", e)
+        _positions_saved["dirty"] |= dirty
+        return
+    _positions_saved["at"] = now
+
+
+def load_carrier_positions() -> None:
+    try:
+        restored = carrier_positions.restore(jump_history.load_positions())
+        logger.debug("Restored %s carrier positions", restored)
+    except Exception as e:
+        logger.error("Failed to load carrier positions: %s", e)
+
+    # older versions kept every position in one EDMC config value (the registry on Windows)
+    raw = config.get_str(CONFIG_CARRIER_POSITIONS) or ""
+    if not raw:
+        return
+    try:
+        items = json.loads(raw)
+        carrier_positions.restore(items)
+        _positions_saved["dirty"].update(item["callsign"] for item in items if "callsign" in item)
+    except (ValueError, TypeError) as e:
+        logger.warning("Discarding unreadable carrier positions: %s", e)
+    config.set(CONFIG_CARRIER_POSITIONS, "")
+
+
+def create_carrier_summary_embed(system: str, k: int = 10) -> Dict[str, Any]:
+    coords = _current_system["coords"] if system == _current_system["name"] else system_coords(system)
+    fields = []
+    if coords:
+        for distance, callsign, carrier_system in carrier_positions.nearest(coords, k):
+            fields.append({
+                "name": callsign,
+                "value": f"```{carrier_system} • {distance:.2f} ly```",
+                "inline": False
+            })
+
+    if fields:
+        description = f"Nearest known carriers to **{system}**."
+    elif coords:
+        description = "No carrier positions recorded yet."
     else:
-        logger.warning(f"Player not on their carrier. Station '{station_name}' doesn't match configured ID '{carrier_id}'")
+        description = f"Coordinates for **{system or 'Unknown'}** are not known yet."
+
+    return {
+        "title": "Carrier Positions",
+        "description": description,
+        "color": 0x1abc9c,
+        "fields": fields,
+        "footer": {"text": f"EDMC FCDN • {len(carrier_positions)} carriers tracked"}
+    }
+
+
+HISTORY_FILE = "fcdn_history.sqlite"
+
+HISTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jumps (
+    id INTEGER PRIMARY KEY,
+    carrier TEXT NOT NULL,
+    origin TEXT,
+    destination TEXT,
+    distance REAL,
+    fuel_used INTEGER,
+    requested_at TEXT,
+    departure_at TEXT NOT NULL,
+    week TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS jumps_carrier_departure ON jumps (carrier, departure_at);
+CREATE INDEX IF NOT EXISTS jumps_departure ON jumps (departure_at);
+CREATE INDEX IF NOT EXISTS jumps_destination ON jumps (destination);
+CREATE TABLE IF NOT EXISTS totals (
+    carrier TEXT PRIMARY KEY,
+    jumps INTEGER NOT NULL,
+    distance REAL NOT NULL,
+    fuel INTEGER NOT NULL,
+    first_at TEXT NOT NULL,
+    last_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS positions (
+    callsign TEXT PRIMARY KEY,
+    system TEXT,
+    x REAL NOT NULL,
+    y REAL NOT NULL,
+    z REAL NOT NULL,
+    timestamp TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS carriers (
+    carrier TEXT PRIMARY KEY,
+    callsign TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS weekly (
+    carrier TEXT NOT NULL,
+    week TEXT NOT NULL,
+    jumps INTEGER NOT NULL,
+    distance REAL NOT NULL,
+    fuel INTEGER NOT NULL,
+    PRIMARY KEY (carrier, week)
+);
+"""
+
+
+def iso_week(timestamp: str) -> str:
+    year, week, _ = datetime.fromisoformat(timestamp.replace('Z', '+00:00')).isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+class JumpHistory:
+    """
+    Append-only SQLite log of carrier jumps. Totals and per-week aggregates are
+    updated in the same transaction as each insert, so digests are a couple of
+    primary key lookups and never rescan the jumps table. Rows are keyed on the
+    numeric CarrierID, which every jump event carries; callsigns are looked up
+    from the carriers table for display. Also holds the last known position of
+    each carrier, one row per callsign.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._conn = None
+        self._lock = threading.Lock()
+        self._callsigns = {}  # carrier ID -> callsign, already written
+
+    def _db(self):
+        # opened on first use so startup never touches disk
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.executescript(HISTORY_SCHEMA)
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def add(self, jump: Dict[str, Any]) -> bool:
+        """Append a jump and fold it into the aggregates. Returns False if it was already recorded"""
+        return self.add_many([jump]) == 1
+
+    def add_many(self, jumps) -> int:
+        added = 0
+        with self._lock:
+            db = self._db()
+            with db:
+                for jump in jumps:
+                    departure = jump["departure_at"]
+                    week = iso_week(departure)
+                    distance = jump.get("distance") or 0.0
+                    fuel = jump.get("fuel_used") or 0
+                    cursor = db.execute(
+                        "INSERT OR IGNORE INTO jumps (carrier, origin, destination, distance, fuel_used,"
+                        " requested_at, departure_at, week) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (jump["carrier"], jump.get("origin"), jump.get("destination"), jump.get("distance"),
+                         jump.get("fuel_used"), jump.get("requested_at"), departure, week),
+                    )
+                    if cursor.rowcount != 1:
+                        continue
+                    db.execute(
+                        "INSERT INTO totals (carrier, jumps, distance, fuel, first_at, last_at) VALUES (?, 1, ?, ?, ?, ?)"
+                        " ON CONFLICT (carrier) DO UPDATE SET jumps = jumps + 1,"
+                        " distance = distance + excluded.distance, fuel = fuel + excluded.fuel,"
+                        " first_at = min(first_at, excluded.first_at), last_at = max(last_at, excluded.last_at)",
+                        (jump["carrier"], distance, fuel, departure, departure),
+                    )
+                    db.execute(
+                        "INSERT INTO weekly (carrier, week, jumps, distance, fuel) VALUES (?, ?, 1, ?, ?)"
+                        " ON CONFLICT (carrier, week) DO UPDATE SET jumps = jumps + 1,"
+                        " distance = distance + excluded.distance, fuel = fuel + excluded.fuel",
+                        (jump["carrier"], week, distance, fuel),
+                    )
+                    added += 1
+        return added
+
+    def name_carriers(self, callsigns: Dict[str, str]) -> None:
+        """Record the callsign of each carrier ID, e.g. from CarrierStats"""
+        changed = {carrier: callsign for carrier, callsign in callsigns.items()
+                   if carrier and callsign and self._callsigns.get(carrier) != callsign}
+        if not changed:
+            return
+        with self._lock:
+            db = self._db()
+            with db:
+                db.executemany(
+                    "INSERT INTO carriers (carrier, callsign) VALUES (?, ?)"
+                    " ON CONFLICT (carrier) DO UPDATE SET callsign = excluded.callsign",
+                    changed.items(),
+                )
+            self._callsigns.update(changed)
+
+    def callsign(self, carrier: str) -> Optional[str]:
+        if carrier in self._callsigns:
+            return self._callsigns[carrier]
+        with self._lock:
+            row = self._db().execute("SELECT callsign FROM carriers WHERE carrier = ?", (carrier,)).fetchone()
+        if row:
+            self._callsigns[carrier] = row[0]
+        return row[0] if row else None
+
+    def latest_carrier(self) -> Optional[str]:
+        """Carrier ID with the most recent jump, for when CarrierStats hasn't been seen this session"""
+        with self._lock:
+            row = self._db().execute("SELECT carrier FROM totals ORDER BY last_at DESC LIMIT 1").fetchone()
+        return row[0] if row else None
+
+    def save_positions(self, positions) -> None:
+        """Upsert carrier positions, as produced by CarrierPositionIndex.snapshot()"""
+        rows = [(p["callsign"], p["system"], *p["coords"], p.get("timestamp") or "") for p in positions]
+        if not rows:
+            return
+        with self._lock:
+            db = self._db()
+            with db:
+                db.executemany(
+                    "INSERT INTO positions (callsign, system, x, y, z, timestamp) VALUES (?, ?, ?, ?, ?, ?)"
+                    " ON CONFLICT (callsign) DO UPDATE SET system = excluded.system, x = excluded.x,"
+                    " y = excluded.y, z = excluded.z, timestamp = excluded.timestamp",
+                    rows,
+                )
+
+    def load_positions(self) -> list:
+        with self._lock:
+            rows = self._db().execute("SELECT callsign, system, x, y, z, timestamp FROM positions").fetchall()
+        return [{"callsign": callsign, "system": system, "coords": (x, y, z), "timestamp": timestamp}
+                for callsign, system, x, y, z, timestamp in rows]
+
+    def last_departure(self, carrier: str) -> Optional[str]:
+        with self._lock:
+            row = self._db().execute("SELECT last_at FROM totals WHERE carrier = ?", (carrier,)).fetchone()
+        return row[0] if row else None
+
+    def digest(self, carrier: str, week: str) -> Dict[str, Any]:
+        """Totals for the carrier and for one ISO week, straight from the aggregate tables"""
+        with self._lock:
+            db = self._db()
+            totals = db.execute(
+                "SELECT jumps, distance, fuel, first_at, last_at FROM totals WHERE carrier = ?", (carrier,)
+            ).fetchone()
+            weekly = db.execute(
+                "SELECT jumps, distance, fuel FROM weekly WHERE carrier = ? AND week = ?", (carrier, week)
+            ).fetchone()
+        digest = {"carrier": carrier, "week": week, "week_jumps": 0, "week_distance": 0.0, "week_fuel": 0,
+                  "jumps": 0, "distance": 0.0, "fuel": 0, "jumps_per_week": 0.0}
+        if weekly:
+            digest["week_jumps"], digest["week_distance"], digest["week_fuel"] = weekly
+        if totals:
+            jumps, distance, fuel, first_at, last_at = totals
+            span = datetime.fromisoformat(last_at.replace('Z', '+00:00')) - datetime.fromisoformat(first_at.replace('Z', '+00:00'))
+            weeks = max(1.0, span.total_seconds() / timedelta(weeks=1).total_seconds())
+            digest.update({"jumps": jumps, "distance": distance, "fuel": fuel, "jumps_per_week": jumps / weeks})
+        return digest
+
+
+jump_history = JumpHistory()
+
+# CarrierJumpRequest waiting for its departure time or a CarrierJump to confirm it
+_pending_jump = {}
+# set once a live event changed _pending_jump, so the deferred load doesn't bring back an older one
+_pending_jump_touched = threading.Event()
+
+
+def jump_record(entry: Dict[str, Any], carrier_id, origin, fuel_level, used_space,
+                coords=None, origin_coords=None) -> Optional[Dict[str, Any]]:
+    """History row for a CarrierJumpRequest; coords maps system names to StarPos"""
+    departure = entry.get("DepartureTime")
+    if not departure or not carrier_id:
+        return None
+    destination = entry.get("SystemName") or entry.get("Body")
+    lookup = coords.get if coords is not None else system_coords
+    a = origin_coords or (lookup(origin) if origin else None)
+    b = lookup(destination) if destination else None
+    distance = math.dist(a, b) if a and b else None
+    return {
+        "carrier": carrier_id,
+        "origin": origin,
+        "destination": destination,
+        "distance": distance,
+        "fuel_used": jump_fuel_cost(min(distance, 500.0), fuel_level, used_space) if distance is not None else None,
+        "requested_at": entry.get("timestamp"),
+        "departure_at": departure,
+    }
+
+
+def track_jump_history(entry: Dict[str, Any], carrier_id, previous, fuel_level, used_space) -> None:
+    """
+    Commit the pending jump once it has happened, and pick up new requests or
+    cancellations. `previous` is the carrier's last known (system, coords, timestamp).
+    """
+    event_type = entry.get("event")
+    timestamp = entry.get("timestamp") or ""
+
+    if _pending_jump and (event_type == "CarrierJump" or timestamp >= _pending_jump["departure_at"]):
+        commit_jump(dict(_pending_jump))
+        _pending_jump.clear()
+        _pending_jump_touched.set()
+        save_pending_jump()
+
+    if event_type == "CarrierJumpRequest":
+        origin, origin_coords = (previous[0], previous[1]) if previous else (None, None)
+        jump = jump_record(entry, carrier_id, origin, fuel_level, used_space, origin_coords=origin_coords)
+        _pending_jump.clear()
+        if jump:
+            _pending_jump.update(jump)
+        _pending_jump_touched.set()
+        save_pending_jump()
+    elif event_type == "CarrierJumpCancelled" and _pending_jump:
+        _pending_jump.clear()
+        _pending_jump_touched.set()
+        save_pending_jump()
+
+
+def commit_jump(jump: Dict[str, Any], post_digest: bool = True) -> None:
+    """
+    Record a jump that happened. When it opens a new week the previous week's digest
+    is posted, or with post_digest=False (shutting down) left for send_due_digest.
+    """
+    try:
+        last = jump_history.last_departure(jump["carrier"])
+        if not jump_history.add(jump):
+            return
+        log_event("jump_recorded", carrier=jump["carrier"], destination=jump["destination"], distance=jump["distance"])
+        # first jump of a new week closes off the previous one
+        if last and iso_week(last) != iso_week(jump["departure_at"]) and config.get_bool(CONFIG_HISTORY_DIGEST):
+            if post_digest:
+                send_history_digest(jump["carrier"], iso_week(last))
+            else:
+                config.set(CONFIG_DIGEST_DUE, json.dumps({"carrier": jump["carrier"], "week": iso_week(last)}))
+    except Exception as e:
+        logger.error("Failed to record jump history: %s", e)
+
+
+def send_due_digest() -> None:
+    """Post a digest held back at shutdown. Runs on the deferred startup thread"""
+    raw = config.get_str(CONFIG_DIGEST_DUE) or ""
+    if not raw:
+        return
+    try:
+        due = json.loads(raw)
+        carrier, week = due["carrier"], due["week"]
+    except (ValueError, KeyError, TypeError) as e:
+        logger.warning("Discarding unreadable pending digest: %s", e)
+        config.set(CONFIG_DIGEST_DUE, "")
+        return
+    if not config.get_bool(CONFIG_HISTORY_DIGEST) or send_history_digest(carrier, week):
+        config.set(CONFIG_DIGEST_DUE, "")
+
+
+def save_pending_jump() -> None:
+    if not _state_loaded.is_set():
+        return
+    config.set(CONFIG_PENDING_JUMP, json.dumps(_pending_jump))
+
+
+def load_pending_jump() -> None:
+    raw = config.get_str(CONFIG_PENDING_JUMP) or ""
+    try:
+        pending = json.loads(raw) if raw else {}
+    except ValueError as e:
+        logger.warning("Discarding unreadable pending jump: %s", e)
+        return
+    if pending and not _pending_jump_touched.is_set():
+        _pending_jump.update(pending)
+
+
+def create_history_digest_embed(digest: Dict[str, Any], carrier_name: str) -> Dict[str, Any]:
+    return {
+        "title": f"Jump Digest • {digest['week']}",
+        "description": f"**{carrier_name}** weekly travel summary.",
+        "color": 0xe67e22,
+        "fields": [
+            {"name": "Jumps this week", "value": f"```{digest['week_jumps']}```", "inline": True},
+            {"name": "Distance this week", "value": f"```{digest['week_distance']:,.2f} ly```", "inline": True},
+            {"name": "Tritium this week", "value": f"```{digest['week_fuel']:,} t```", "inline": True},
+            {"name": "Total jumps", "value": f"```{digest['jumps']}```", "inline": True},
+            {"name": "Total distance", "value": f"```{digest['distance']:,.2f} ly```", "inline": True},
+            {"name": "Total tritium", "value": f"```{digest['fuel']:,} t```", "inline": True},
+            {"name": "Average jumps per week", "value": f"```{digest['jumps_per_week']:.1f}```", "inline": False},
+        ],
+        "footer": {"text": "EDMC FCDN • Jump History"}
+    }
+
+
+def send_history_digest(carrier: str, week: Optional[str] = None) -> bool:
+    webhook_url = config.get_str(CONFIG_WEBHOOK) or ""
+    if not webhook_url.startswith(
+        ("https://discord.com/api/webhooks/", "https://discordapp.com/api/webhooks/")
+    ):
+        logger.warning("Invalid webhook URL format")
         return False
 
+    week = week or iso_week(datetime.now(timezone.utc).isoformat())
+    digest = jump_history.digest(carrier, week)
+    callsign = jump_history.callsign(carrier) or carrier
+    embed = create_history_digest_embed(digest, f"{config.get_str(CONFIG_CARRIER_NAME) or ''} ({callsign})")
+    try:
+        response = deliver(webhook_url, {"embeds": [embed]}, "digest", timeout=10)
+        if response.status_code in [200, 204]:
+            logger.info("FCDN jump digest posted for %s %s", carrier, week)
+            return True
+        logger.warning("FCDN jump digest failed with status: %s", response.status_code)
+    except Exception as e:
+        logger.error("FCDN jump digest error: %s", e)
+    return False
+
+
+# Only these journal events matter to the backfill; lines without them skip JSON parsing
+_BACKFILL_EVENTS = ('"CarrierJumpRequest"', '"CarrierJumpCancelled"', '"CarrierStats"', '"StarPos"')
+
+
+def parse_journal_file(path: str) -> tuple:
+    """
+    Jumps requested in one journal file, StarPos of every system it mentions and
+    the callsigns of carrier IDs it saw. Runs in a worker process during backfill,
+    so it only touches its own file: the request still open at the end of the file
+    and cancels with no request before them are returned separately, as
+    (jumps, trailing, cancels, coords, callsigns), for backfill_history to match up.
+    """
+    jumps, cancels, coords, callsigns = [], [], {}, {}
+    pending = None
+    fuel, used = 0, 0
+    with open(path, encoding="utf-8", errors="replace") as journal:
+        for line in journal:
+            if not any(marker in line for marker in _BACKFILL_EVENTS):
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            event_type = entry.get("event")
+            if entry.get("StarPos") and entry.get("StarSystem"):
+                coords[entry["StarSystem"]] = tuple(float(c) for c in entry["StarPos"])
+            if event_type == "CarrierStats":
+                if entry.get("CarrierID") and entry.get("Callsign"):
+                    callsigns[str(entry["CarrierID"])] = entry["Callsign"]
+                fuel = int(entry.get("FuelLevel") or 0)
+                used = carrier_used_space(entry)
+            elif event_type == "CarrierJumpRequest":
+                if pending:
+                    jumps.append(pending)
+                pending = {
+                    "entry": entry,
+                    # history is keyed on the carrier ID, which every request carries
+                    "carrier": str(entry.get("CarrierID") or ""),
+                    "fuel": fuel,
+                    "used": used,
+                }
+            elif event_type == "CarrierJumpCancelled":
+                if pending is None:
+                    cancels.append((entry.get("timestamp") or "", str(entry.get("CarrierID") or "")))
+                pending = None
+    return jumps, pending, cancels, coords, callsigns
+
+
+def resolve_cancels(trailing: list, cancels: list) -> list:
+    """
+    Drop requests left open at the end of a journal file that a later file
+    cancelled before departure. Returns the requests that still stand.
+    """
+    standing = sorted(trailing, key=lambda r: r["entry"].get("timestamp") or "")
+    for cancelled_at, carrier in sorted(cancels):
+        # a cancel applies to the carrier's latest request before it
+        earlier = [r for r in standing if r["carrier"] == carrier and (r["entry"].get("timestamp") or "") < cancelled_at]
+        if earlier and cancelled_at < (earlier[-1]["entry"].get("DepartureTime") or ""):
+            standing.remove(earlier[-1])
+    return standing
+
+
+def backfill_history(journal_dir, workers: Optional[int] = None) -> int:
+    """
+    Build the history store from old journal files, parsing them in a process
+    pool. Returns how many jumps were added; already recorded ones are skipped.
+    """
+    import concurrent.futures
+    import multiprocessing
+    import sys
+
+    paths = sorted(str(p) for p in Path(journal_dir).glob("Journal.*.log"))
+    if not paths:
+        return 0
+
+    # Worker processes must be able to import this module. EDMC's frozen build would
+    # relaunch itself and loads plugins under a private name, so use threads there.
+    # Never fork: EDMC is running Tk, the follow-up scheduler and this thread, and a
+    # forked child can inherit their locks held.
+    if not getattr(sys, "frozen", False) and importlib.util.find_spec(__name__) is not None:
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        pool = concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method))
+    else:
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+
+    requests_found, trailing, cancels, coords, callsigns = [], [], [], {}, {}
+    with pool:
+        for file_jumps, file_pending, file_cancels, file_coords, file_callsigns in pool.map(
+                parse_journal_file, paths, chunksize=8):
+            requests_found.extend(file_jumps)
+            if file_pending:
+                trailing.append(file_pending)
+            cancels.extend(file_cancels)
+            coords.update(file_coords)
+            callsigns.update(file_callsigns)
+    # a request and its cancel can land in different files, e.g. across a game restart
+    requests_found.extend(resolve_cancels(trailing, cancels))
+    # like live tracking, only jumps whose departure has passed are history; one still
+    # ahead may yet be cancelled and the store is append-only
+    now = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    requests_found = [r for r in requests_found if (r["entry"].get("DepartureTime") or "") <= now]
+
+    # each jump starts where the carrier's previous one ended
+    requests_found.sort(key=lambda r: r["entry"].get("DepartureTime") or "")
+    last_destination = {}
+    jumps = []
+    for request in requests_found:
+        entry = request["entry"]
+        carrier = request["carrier"]
+        jump = jump_record(entry, carrier, last_destination.get(carrier), request["fuel"], request["used"], coords)
+        if jump:
+            jumps.append(jump)
+            last_destination[carrier] = jump["destination"]
+
+    added = jump_history.add_many(jumps)
+    jump_history.name_carriers(callsigns)
+    log_event("history_backfill", level=logging.INFO, files=len(paths), jumps=len(jumps), added=added)
+    return added
+
 
 def create_discord_embed(cmdr: str, system: str, station: str,
                          entry: Dict[str, Any], fuel_level: int, used_space: int, carrier_id : int,
@@ -444,7 +1752,7 @@ def create_discord_embed(cmdr: str, system: str, station: str,
     
     event_type = entry["event"]
     carrier_name = config.get_str(CONFIG_CARRIER_NAME) + " (" + carrier_id + ")"
-    logger.debug(f"Assigned carrier name is: {carrier_name}")
+    logger.debug("Assigned carrier name is: %s", carrier_name)
 
     embed = {
         "timestamp": entry.get("timestamp", ""),
@@ -454,9 +1762,9 @@ def create_discord_embed(cmdr: str, system: str, station: str,
     # Add image only if URL is valid
     if is_valid_url(image_url):
         embed["image"] = {"url": image_url.strip()}
-        logger.debug(f"Added image URL to embed: {image_url}")
+        logger.debug("Added image URL to embed: %s", image_url)
     elif image_url and image_url.strip():
-        logger.warning(f"Invalid image URL format (must start with http:// or https://): {image_url}")
+        logger.warning("Invalid image URL format (must start with http:// or https://): %s", image_url)
     
     if event_type == "CarrierJumpRequest":
         departure_time = entry.get("DepartureTime", "")
@@ -482,7 +1790,7 @@ def create_discord_embed(cmdr: str, system: str, station: str,
             show_remaining = config.get_bool(CONFIG_SHOW_REMAINING)
 
             
-            logger.debug(f"Checkbox states - Distance: {show_distance}, Usage: {show_usage}, Remaining: {show_remaining}")
+            logger.debug("Checkbox states - Distance: %s, Usage: %s, Remaining: %s", show_distance, show_usage, show_remaining)
             
             #whether to add jump distance info
             if show_distance and jump_distance is not None:
@@ -533,7 +1841,7 @@ def create_discord_embed(cmdr: str, system: str, station: str,
 
         # Check if we should show tritium on jump cancel
         show_tritium_cancel = config.get_bool(CONFIG_SHOW_TRITIUM_CANCEL)
-        logger.debug(f"Show tritium on cancel: {show_tritium_cancel}, Fuel level: {fuel_level}")
+        logger.debug("Show tritium on cancel: %s, Fuel level: %s", show_tritium_cancel, fuel_level)
         
         if show_tritium_cancel and fuel_level not in (None, 0):
             fields.append({"name": "Tritium Level", "value": f"```{fuel_level}t```", "inline": False})
@@ -571,7 +1879,7 @@ def fcdn_sell_action() -> None:
     
     # Validate image URL
     if image_url and not is_valid_url(image_url):
-        logger.warning(f"Image URL should start with http:// or https://: {image_url}")
+        logger.warning("Image URL should start with http:// or https://: %s", image_url)
     
     # Compact items description
     items_description = ""
@@ -590,18 +1898,18 @@ def fcdn_sell_action() -> None:
     # Add image only if URL is valid
     if is_valid_url(image_url):
         embed["image"] = {"url": image_url.strip()}
-        logger.debug(f"Posting sell action with image URL: {image_url}")
+        logger.debug("Posting sell action with image URL: %s", image_url)
     
     try:
         payload = {"embeds": [embed]}
-        response = requests.post(webhook_url, json=payload, timeout=10)
+        response = deliver(webhook_url, payload, "sell", timeout=10)
         if response.status_code in [200, 204]:
-            logger.info(f"FCDN sell action posted successfully for {len(market_items)} items")
+            logger.info("FCDN sell action posted successfully for %s items", len(market_items))
         else:
-            logger.warning(f"FCDN sell action failed with status: {response.status_code}")
-            logger.debug(f"Response content: {response.text}")
+            logger.warning("FCDN sell action failed with status: %s", response.status_code)
+            logger.debug("Response content: %s", response.text)
     except Exception as e:
-        logger.error(f"FCDN sell action error: {e}")
+        logger.error("FCDN sell action error: %s", e)
 
 def fcdn_buy_action():
     """
@@ -627,7 +1935,7 @@ def fcdn_buy_action():
     
     # Validate image URL
     if image_url and not is_valid_url(image_url):
-        logger.warning(f"Image URL should start with http:// or https://: {image_url}")
+        logger.warning("Image URL should start with http:// or https://: %s", image_url)
     
     # Compact items description
     items_description = ""
@@ -646,18 +1954,53 @@ def fcdn_buy_action():
     # Add image only if URL is valid
     if is_valid_url(image_url):
         embed["image"] = {"url": image_url.strip()}
-        logger.debug(f"Posting buy action with image URL: {image_url}")
+        logger.debug("Posting buy action with image URL: %s", image_url)
+    
+    try:
+        payload = {"embeds": [embed]}
+        response = deliver(webhook_url, payload, "buy", timeout=10)
+        if response.status_code in [200, 204]:
+            logger.info("FCDN buy action posted successfully for %s items", len(market_items))
+        else:
+            logger.warning("FCDN buy action failed with status: %s", response.status_code)
+            logger.debug("Response content: %s", response.text)
+    except Exception as e:
+        logger.error("FCDN buy action error: %s", e)
+
+def fcdn_carrier_summary_action() -> None:
+    """
+    Post the nearest known carriers to the CMDR's current system to Discord webhook.
+    """
+    webhook_url = config.get_str(CONFIG_WEBHOOK) or ""
+    
+    if not webhook_url.startswith(
+        ("https://discord.com/api/webhooks/", "https://discordapp.com/api/webhooks/")
+    ):
+        logger.warning("Invalid webhook URL format")
+        return
+    
+    embed = create_carrier_summary_embed(_current_system["name"])
     
     try:
         payload = {"embeds": [embed]}
-        response = requests.post(webhook_url, json=payload, timeout=10)
+        response = deliver(webhook_url, payload, "carrier summary", timeout=10)
         if response.status_code in [200, 204]:
-            logger.info(f"FCDN buy action posted successfully for {len(market_items)} items")
+            logger.info("FCDN carrier summary posted successfully for %s carriers", len(embed['fields']))
         else:
-            logger.warning(f"FCDN buy action failed with status: {response.status_code}")
-            logger.debug(f"Response content: {response.text}")
+            logger.warning("FCDN carrier summary failed with status: %s", response.status_code)
+            logger.debug("Response content: %s", response.text)
     except Exception as e:
-        logger.error(f"FCDN buy action error: {e}")
+        logger.error("FCDN carrier summary error: %s", e)
+
+def fcdn_digest_action() -> None:
+    """
+    Post this week's jump digest for the configured carrier to Discord webhook.
+    """
+    carrier = _carrier_state["number"] or jump_history.latest_carrier()
+    if not carrier:
+        logger.warning("No carrier jumps recorded yet")
+        return
+    send_history_digest(carrier)
 
 def test_webhook() -> None:
     """
@@ -674,7 +2017,7 @@ def test_webhook() -> None:
     
     # Validate image URL and provide feedback
     if image_url and not is_valid_url(image_url):
-        logger.warning(f"Image URL should start with http:// or https://: {image_url}")
+        logger.warning("Image URL should start with http:// or https://: %s", image_url)
     
     embed = {
         "title": "Webhook Test",
@@ -687,39 +2030,146 @@ def test_webhook() -> None:
     if is_valid_url(image_url):
         embed["image"] = {"url": image_url.strip()}
         embed["description"] += "\nIf you've entered a valid fleet carrier image URL, your image should be visible below."
-        logger.debug(f"Testing webhook with image URL: {image_url}")
+        logger.debug("Testing webhook with image URL: %s", image_url)
     else:
         embed["description"] += "\nNote: No valid image URL provided or URL format is incorrect."
     
     try:
         payload = {"embeds": [embed]}
-        response = requests.post(webhook_url, json=payload, timeout=10)
+        response = deliver(webhook_url, payload, "test", timeout=10)
         if response.status_code in [200, 204]:
             logger.info("Test webhook sent successfully")
         else:
-            logger.warning(f"Test webhook failed with status: {response.status_code}")
+            logger.warning("Test webhook failed with status: %s", response.status_code)
     except Exception as e:
-        logger.error(f"Test webhook error: {e}")
+        logger.error("Test webhook error: %s", e)
+
+
+# How often the settings window checks on a running journal import
+BACKFILL_POLL_MS = 250
+# set while an import runs; each one scans the whole journal directory
+_backfill_running = threading.Event()
+# Tk is not thread-safe: the import thread only queues its result, the Tk thread shows it
+_backfill_results = queue.Queue()
+
+
+def set_backfill_status(text: str, busy: bool) -> None:
+    """Show import progress in the settings window, if it is still open. Tk thread only"""
+    for widget, option, value in ((config_state.history_label, "text", text),
+                                  (config_state.history_button, "state", tk.DISABLED if busy else tk.NORMAL)):
+        try:
+            if widget is not None and widget.winfo_exists():
+                widget.config(**{option: value})
+        except tk.TclError:
+            pass
+
+
+def poll_backfill() -> None:
+    try:
+        set_backfill_status(_backfill_results.get_nowait(), busy=False)
+        return
+    except queue.Empty:
+        pass
+    # stops once the settings window is gone; plugin_prefs picks it up again when reopened
+    label = config_state.history_label
+    try:
+        if label is not None and label.winfo_exists():
+            label.after(BACKFILL_POLL_MS, poll_backfill)
+    except tk.TclError:
+        pass
+
+
+def start_history_backfill() -> None:
+    """
+        Import old journals on a background thread so the settings window stays responsive
+    """
+    journal_dir = config.get_str("journaldir") or getattr(config, "default_journal_dir", None)
+    if not journal_dir:
+        logger.warning("Journal directory not known, cannot import history")
+        return
+    if _backfill_running.is_set():
+        logger.info("Journal history import already running")
+        return
+    _backfill_running.set()
+
+    def run():
+        try:
+            added = backfill_history(journal_dir)
+            _backfill_results.put(f"Imported {added} new jumps")
+        except Exception as e:
+            logger.error("Journal history import failed: %s", e)
+            _backfill_results.put("Import failed, see log")
+        finally:
+            _backfill_running.clear()
+
+    set_backfill_status("Importing journal history...", busy=True)
+    threading.Thread(target=run, name="FCDN backfill", daemon=True).start()
+    poll_backfill()
+
+
+def save_diagnostics() -> Optional[Path]:
+    """
+        Dump the flight recorder next to the plugin, for attaching to bug reports
+    """
+    path = Path(config_state.plugin_dir or Path(__file__).resolve().parent) / "fcdn_diagnostics.txt"
+    try:
+        path.write_text(f"FCDN {config_state.version} diagnostics\n{flight_recorder.dump()}\n", encoding="utf-8")
+    except OSError as e:
+        logger.error("Could not save diagnostics: %s", e)
+        message, path = f"Could not save diagnostics: {e}", None
+    else:
+        logger.info("Saved %s diagnostic events to %s", len(flight_recorder), path)
+        message = f"Saved {len(flight_recorder)} events to {path.name}"
+    if config_state.diagnostics_label is not None:
+        config_state.diagnostics_label.config(text=message)
+    return path
 
 
 def journal_entry(cmdr: str, is_beta: bool, system: str, station: str,
                   entry: Dict[str, Any], state: Dict[str, Any]) -> Optional[str]:
     
     event_type = entry.get("event")
-    #integration is for EDSM configs
-    integration_enabled = bool(config.get_bool(CONFIG_FUEL_MODE))          
-    show_trit_on_cancel = bool(config.get_bool(CONFIG_SHOW_TRITIUM_CANCEL))
+    follow_ups_enabled = bool(config.get_bool(CONFIG_FOLLOW_UPS))
 
     # Grabs carrier info when management screen updated
-    # update CarrierStats if *either* integration is on OR cancel-fuel is enabled
-    if (integration_enabled or show_trit_on_cancel) and event_type == "CarrierStats": 
+    # always tracked, it names the carrier ID jump history is keyed on
+    if event_type == "CarrierStats": 
         update_carrier_state(entry)
+        if not is_beta and entry.get("CarrierID") and entry.get("Callsign"):
+            try:
+                jump_history.name_carriers({str(entry["CarrierID"]): entry["Callsign"]})
+            except Exception as e:
+                logger.error("Failed to record carrier callsign: %s", e)
         return None
 
     fuel_level, used_space, carrier_id = get_carrier_state()
 
     # logger.debug(f"Detected carrier callsign: {carrier_id}")
 
+    if not is_beta:
+        # where the carrier is now, read before this event updates any positions
+        previous = jump_origin(state, system, carrier_id) if event_type == "CarrierJumpRequest" else None
+        # same key as the backfill uses, whether or not CarrierStats was seen yet
+        history_key = str(entry.get("CarrierID") or "")
+        if event_type == "CarrierJumpRequest" and history_key:
+            _carrier_state["number"] = history_key
+        track_jump_history(entry, history_key, previous, fuel_level, used_space)
+        _positions_saved["dirty"].update(track_carrier_positions(entry, state, carrier_id))
+        save_carrier_positions()
+
+    # CarrierJump is only written while aboard, so it confirms our own carrier arrived
+    if event_type == "CarrierJump" and follow_ups_enabled and not is_beta:
+        if not is_player_on_their_carrier(entry, carrier_id):
+            return None
+        follow_up_scheduler.cancel(follow_up_key(carrier_id))
+        save_follow_ups()
+        send_follow_up(follow_up_key(carrier_id), FOLLOW_UP_ARRIVED, {
+            "cmdr": cmdr,
+            "destination": entry.get("StarSystem"),
+            "body": entry.get("Body"),
+        })
+        return None
+
     if event_type not in ["CarrierJumpRequest", "CarrierJumpCancelled"] or is_beta:
         return None
     
@@ -736,25 +2186,39 @@ def journal_entry(cmdr: str, is_beta: bool, system: str, station: str,
     
     # CRITICAL: Check if player is on their own carrier before processing
     on_own_carrier = is_player_on_their_carrier(state, carrier_id)
-    logger.info(f"Processing {event_type} - Player on their carrier: {on_own_carrier}")
+    log_event("jump_event", journal_event=event_type, carrier=carrier_id, on_own_carrier=on_own_carrier)
     
     image_url = config.get_str(CONFIG_IMAGE_URL) or ""
     
     # Log image URL status
     if image_url and not is_valid_url(image_url):
-        logger.warning(f"Invalid image URL format (must start with http:// or https://): {image_url}")
+        logger.warning("Invalid image URL format (must start with http:// or https://): %s", image_url)
     
     embed = create_discord_embed(cmdr, system, station, entry, fuel_level, used_space, carrier_id, image_url, on_own_carrier)
+
+    if follow_ups_enabled:
+        key = follow_up_key(carrier_id)
+        if event_type == "CarrierJumpRequest":
+            timers = follow_up_timers(entry.get("DepartureTime", ""), {
+                "cmdr": cmdr,
+                "destination": entry.get("SystemName") or entry.get("Body"),
+            })
+            follow_up_scheduler.schedule(key, timers)
+            log_event("follow_ups_scheduled", carrier=key, kinds=[t[0] for t in timers])
+        else:
+            cancelled = follow_up_scheduler.cancel(key)
+            log_event("follow_ups_cancelled", carrier=key, cancelled=cancelled)
+        save_follow_ups()
     
     try:
-        logger.info(f"Sending {event_type} notification to Discord (on_own_carrier: {on_own_carrier})")
-        response = requests.post(webhook_url, json={"embeds": [embed]}, timeout=30)
+        logger.debug("Sending %s notification to Discord (on_own_carrier: %s)", event_type, on_own_carrier)
+        response = deliver(webhook_url, {"embeds": [embed]}, event_type, timeout=30)
         if response.status_code in [200, 204]:
             logger.debug("Discord webhook sent successfully")
             return None
         else:
-            logger.warning(f"Discord webhook failed with status: {response.status_code}")
+            logger.warning("Discord webhook failed with status: %s", response.status_code)
             return "FCDN: Discord webhook error."
     except Exception as e:
-        logger.error(f"Error sending to Discord: {e}")
+        logger.error("Error sending to Discord: %s", e)
         return "FCDN: Error sending to Discord."
@@ -0,0 +1,12 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# EDMC's config and myNotebook, or stand-ins when not run from an EDMC checkout.
+# They go on sys.path rather than into sys.modules so backfill worker processes find them too.
+try:
+    import config  # noqa: F401
+    import myNotebook  # noqa: F401
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent / "stubs"))
@@ -0,0 +1,24 @@
+"""
+Minimal stand-in for EDMC's config module, used by the tests and benchmarks when
+they are not run from an EDMC source checkout. Settings are kept in a plain dict.
+"""
+
+appname = "EDMarketConnector"
+appversion = "0"
+
+
+class _Config(dict):
+    def get_str(self, key, default=None):
+        return self.get(key, default)
+
+    def get_bool(self, key, default=None):
+        return self.get(key, default)
+
+    def get_int(self, key, default=0):
+        return self.get(key, default)
+
+    def set(self, key, value):
+        self[key] = value
+
+
+config = _Config()
@@ -0,0 +1,3 @@
+"""Minimal stand-in for EDMC's myNotebook module; the prefs UI is not exercised"""
+
+Notebook = Frame = object
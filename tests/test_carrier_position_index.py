@@ -0,0 +1,98 @@
+import math
+import random
+
+import pytest
+
+import load
+
+
+def brute_nearest(points, q, k):
+    return sorted((math.dist(q, p), c) for c, p in points.items())[:k]
+
+
+def brute_within(points, q, radius):
+    return sorted((math.dist(q, p), c) for c, p in points.items() if math.dist(q, p) <= radius)
+
+
+def check(index, points, queries, k=10, radius=150.0):
+    for q in queries:
+        got, expected = index.nearest(q, k), brute_nearest(points, q, k)
+        assert [c for _, c, _ in got] == [c for _, c in expected]
+        assert [d for d, _, _ in got] == pytest.approx([d for d, _ in expected])
+        assert sorted(c for _, c, _ in index.within(q, radius)) == sorted(c for _, c in brute_within(points, q, radius))
+
+
+@pytest.fixture
+def fleet():
+    rng = random.Random(27)
+    points = {f"C{i:04d}": (rng.gauss(0, 2000), rng.gauss(0, 300), rng.gauss(0, 2000)) for i in range(3000)}
+    index = load.CarrierPositionIndex()
+    index.restore([{"callsign": c, "system": f"S{c}", "coords": p} for c, p in points.items()])
+    queries = [(0, 0, 0), (60000, 0, 60000), (-9530.5, -910.28, 19808.125)] + \
+        [rng.choice(list(points.values())) for _ in range(20)]
+    return index, points, queries
+
+
+def test_matches_brute_force(fleet):
+    index, points, queries = fleet
+    check(index, points, queries)
+    assert len(index) == len(points)
+
+
+def test_moves_and_removes_before_rebuild(fleet):
+    index, points, queries = fleet
+    rng = random.Random(28)
+    # few enough changes that they all sit in the delta buffer, with stale tree entries
+    for callsign in rng.sample(sorted(points), 20):
+        points[callsign] = (rng.gauss(0, 2000), 0.0, rng.gauss(0, 2000))
+        index.update(callsign, "moved", points[callsign])
+    for callsign in rng.sample(sorted(points), 10):
+        assert index.remove(callsign)
+        del points[callsign]
+    assert 0 < len(index._delta) and index._tree is not None
+
+    check(index, points, queries + [rng.choice(list(points.values())) for _ in range(10)])
+    assert not index.remove("nobody")
+
+
+def test_moves_past_rebuild_threshold(fleet):
+    index, points, queries = fleet
+    rng = random.Random(29)
+    for callsign in sorted(points)[:500]:
+        points[callsign] = (rng.gauss(0, 2000), rng.gauss(0, 300), rng.gauss(0, 2000))
+        index.update(callsign, "moved", points[callsign])
+
+    check(index, points, queries)
+
+
+def test_nearest_edge_cases():
+    index = load.CarrierPositionIndex()
+    assert index.nearest((0, 0, 0), 5) == [] and index.within((0, 0, 0), 100) == []
+
+    index.update("A", "Sol", (0, 0, 0))
+    index.update("B", "Alpha Centauri", (3, 0, 4))
+    assert index.nearest((0, 0, 0), 0) == []
+    assert index.nearest((0, 0, 0), 5) == [(0.0, "A", "Sol"), (5.0, "B", "Alpha Centauri")]
+    assert index.within((0, 0, 0), 5.0) == [(0.0, "A", "Sol"), (5.0, "B", "Alpha Centauri")]
+
+
+def test_restore_keeps_newer_live_positions():
+    index = load.CarrierPositionIndex()
+    index.update("A", "Colonia", (-9530.5, -910.28, 19808.125), "2026-01-02T00:00:00Z")
+
+    restored = index.restore([
+        {"callsign": "A", "system": "Sol", "coords": (0, 0, 0), "timestamp": "2026-01-01T00:00:00Z"},
+        {"callsign": "B", "system": "Sol", "coords": (0, 0, 0), "timestamp": "2026-01-01T00:00:00Z"},
+        {"callsign": "C", "system": "Sol"},
+    ])
+
+    assert restored == 2
+    assert index.get("A")[0] == "Colonia"
+    assert [c for _, c, _ in index.nearest((0, 0, 0), 5)] == ["B", "A"]
+
+
+def test_snapshot_round_trip(fleet):
+    index, points, queries = fleet
+    copy = load.CarrierPositionIndex()
+    copy.restore(index.snapshot())
+    check(copy, points, queries[:5])
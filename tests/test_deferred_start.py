@@ -0,0 +1,89 @@
+import json
+
+import pytest
+
+import load
+
+REQUEST = {
+    "event": "CarrierJumpRequest", "CarrierID": 42, "SystemName": "Sol",
+    "timestamp": "2026-01-01T10:00:00Z", "DepartureTime": "2026-01-01T10:15:00Z",
+}
+CANCEL = {"event": "CarrierJumpCancelled", "CarrierID": 42, "timestamp": "2026-01-01T10:05:00Z"}
+
+
+@pytest.fixture
+def fresh_start(monkeypatch, tmp_path):
+    """Module state as plugin_start3 leaves it, before the deferred load has run"""
+    history = load.JumpHistory(tmp_path / load.HISTORY_FILE)
+    monkeypatch.setattr(load, "jump_history", history)
+    monkeypatch.setattr(load, "config", type(load.config)())
+    monkeypatch.setattr(load, "follow_up_scheduler", load.FollowUpScheduler(lambda *args: None))
+    monkeypatch.setattr(load, "carrier_positions", load.CarrierPositionIndex())
+    monkeypatch.setattr(load, "check_latest_version", lambda: None)
+    monkeypatch.setattr(load, "_positions_saved", {"dirty": set(), "at": 0.0})
+    load._state_loaded.clear()
+    load._pending_jump.clear()
+    load._pending_jump_touched.clear()
+    yield load.config
+    history.close()
+    load._state_loaded.clear()
+    load._pending_jump.clear()
+    load._pending_jump_touched.clear()
+
+
+def test_saves_wait_for_the_deferred_load(fresh_start):
+    colonia = {"callsign": "XYZ-111", "system": "Colonia", "coords": (-9530.5, -910.28, 19808.125), "timestamp": ""}
+    load.jump_history.save_positions([colonia])
+
+    load.carrier_positions.update("ABC-123", "Sol", (0, 0, 0), "2026-01-01T10:00:00Z")
+    load._positions_saved["dirty"].add("ABC-123")
+    load.save_carrier_positions(force=True)
+    assert load.jump_history.load_positions() == [colonia]
+
+    load.deferred_start()
+    assert {item["callsign"] for item in load.jump_history.load_positions()} == {"XYZ-111", "ABC-123"}
+    assert len(load.carrier_positions) == 2
+
+
+def test_positions_move_out_of_edmc_config(fresh_start):
+    config = fresh_start
+    saved = [{"callsign": "XYZ-111", "system": "Colonia", "coords": [-9530.5, -910.28, 19808.125], "timestamp": ""}]
+    config.set(load.CONFIG_CARRIER_POSITIONS, json.dumps(saved))
+
+    load.deferred_start()
+    assert config[load.CONFIG_CARRIER_POSITIONS] == ""
+    assert [item["callsign"] for item in load.jump_history.load_positions()] == ["XYZ-111"]
+    assert load.carrier_positions.get("XYZ-111")[0] == "Colonia"
+
+
+def test_only_moved_carriers_are_written(fresh_start, monkeypatch):
+    load.deferred_start()
+    load.carrier_positions.restore(
+        [{"callsign": f"C{i}", "system": "S", "coords": (i, 0, 0), "timestamp": ""} for i in range(1000)])
+    written = []
+    monkeypatch.setattr(load.jump_history, "save_positions", written.extend)
+
+    docked = {"event": "Docked", "StationType": "FleetCarrier", "StationName": "C5",
+              "StarSystem": "Sol", "StarPos": [0, 0, 0], "timestamp": "2026-01-01T10:00:00Z"}
+    load._positions_saved["dirty"].update(load.track_carrier_positions(docked, {"StarPos": [0, 0, 0]}, None))
+    load.save_carrier_positions(force=True)
+    assert [item["callsign"] for item in written] == ["C5"]
+
+
+def test_live_cancel_beats_persisted_state(fresh_start):
+    config = fresh_start
+    config.set(load.CONFIG_FOLLOW_UPS, True)
+    config.set(load.CONFIG_PENDING_JUMP, json.dumps(load.jump_record(REQUEST, "42", None, 0, 0, coords={})))
+    config.set(load.CONFIG_FOLLOW_UP_TIMERS, json.dumps(
+        [{"carrier": "ABC-123", "kind": "jump", "due": load.time.time() + 600, "data": {}}]))
+
+    # the cancel is journalled before the deferred load gets to run
+    load.track_jump_history(REQUEST, "42", None, 0, 0)
+    load.track_jump_history(CANCEL, "42", None, 0, 0)
+    load.follow_up_scheduler.cancel("ABC-123")
+
+    load.deferred_start()
+    assert load._pending_jump == {}
+    assert load.follow_up_scheduler.pending("ABC-123") == []
+    assert json.loads(config[load.CONFIG_PENDING_JUMP]) == {}
+    assert json.loads(config[load.CONFIG_FOLLOW_UP_TIMERS]) == []
@@ -0,0 +1,201 @@
+import json
+import random
+
+import pytest
+
+import load
+
+CARRIERS = 5000
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class NoScanHeap(list):
+    """Heap that fails the test if anything walks it"""
+
+    def __iter__(self):
+        raise AssertionError("heap was scanned")
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def fired():
+    return []
+
+
+@pytest.fixture
+def scheduler(clock, fired):
+    return load.FollowUpScheduler(lambda carrier, kind, data: fired.append((carrier, kind, data)), clock=clock)
+
+
+def schedule_fleet(scheduler, clock, count=CARRIERS, seed=26):
+    """Lockdown and jump timers for `count` carriers at random offsets. Returns {carrier: [(due, kind)]}"""
+    rng = random.Random(seed)
+    expected = {}
+    for i in range(count):
+        carrier = f"C{i:05d}"
+        lockdown = clock.now + rng.uniform(60, 3600)
+        jump = lockdown + load.LOCKDOWN_LEAD.total_seconds()
+        timers = [("lockdown", lockdown, {"n": i}), ("jump", jump, {"n": i})]
+        scheduler.schedule(carrier, timers)
+        expected[carrier] = [(due, kind) for kind, due, _ in timers]
+    return expected
+
+
+def test_fires_in_due_order(scheduler, clock, fired):
+    expected = schedule_fleet(scheduler, clock)
+    assert len(scheduler) == 2 * CARRIERS
+
+    midpoint = clock.now + 1800
+    scheduler.run_due(midpoint)
+    assert all(due <= midpoint for carrier, kind, _ in fired for due, k in expected[carrier] if k == kind)
+
+    scheduler.run_due(clock.now + 9000)
+    assert len(fired) == 2 * CARRIERS
+    dues = [dict((k, due) for due, k in expected[carrier])[kind] for carrier, kind, _ in fired]
+    assert dues == sorted(dues)
+    assert len(scheduler) == 0 and not scheduler._heap
+
+
+def test_reschedule_replaces_previous_timers(scheduler, clock, fired):
+    scheduler.schedule("C1", [("lockdown", clock.now + 10, {}), ("jump", clock.now + 20, {})])
+    scheduler.schedule("C1", [("jump", clock.now + 30, {"second": True})])
+
+    assert scheduler.pending("C1") == [(clock.now + 30, "jump")]
+    scheduler.run_due(clock.now + 60)
+    assert fired == [("C1", "jump", {"second": True})]
+
+
+def test_cancel_does_not_scan_the_heap(scheduler, clock, fired):
+    schedule_fleet(scheduler, clock)
+    size = len(scheduler._heap)
+    scheduler._heap = NoScanHeap(scheduler._heap)
+
+    # below the compaction threshold a cancel only drops the carrier's token
+    for i in range(10):
+        assert scheduler.cancel(f"C{i:05d}")
+    assert not scheduler.cancel("C00000")
+    assert len(scheduler._heap) == size
+    assert scheduler._stale == 20
+
+    scheduler._heap = scheduler._heap[:]
+    scheduler.run_due(clock.now + 9000)
+    assert len(fired) == 2 * (CARRIERS - 10)
+    assert not {carrier for carrier, _, _ in fired} & {f"C{i:05d}" for i in range(10)}
+    assert scheduler._stale == 0
+
+
+def test_compaction_drops_cancelled_entries(scheduler, clock, fired):
+    schedule_fleet(scheduler, clock)
+    for i in range(CARRIERS - 100):
+        scheduler.cancel(f"C{i:05d}")
+
+    # compaction kicks in whenever stale entries outnumber live ones
+    assert len(scheduler._heap) < 2 * 2 * 100 + 2 * 64
+    assert scheduler._stale * 2 <= len(scheduler._heap) or scheduler._stale <= 64
+    assert len(scheduler) == 200
+
+    scheduler.run_due(clock.now + 9000)
+    assert sorted({carrier for carrier, _, _ in fired}) == [f"C{i:05d}" for i in range(CARRIERS - 100, CARRIERS)]
+
+
+def test_snapshot_restore_round_trip(scheduler, clock, fired):
+    schedule_fleet(scheduler, clock, count=1000)
+    for i in range(0, 1000, 3):
+        scheduler.cancel(f"C{i:05d}")
+    snapshot = json.loads(json.dumps(scheduler.snapshot()))
+    assert [item["due"] for item in snapshot] == sorted(item["due"] for item in snapshot)
+
+    restored_fired = []
+    restored = load.FollowUpScheduler(lambda *args: restored_fired.append(args), clock=clock)
+    assert restored.restore(snapshot) == len(snapshot)
+    assert restored.snapshot() == snapshot
+
+    scheduler.run_due(clock.now + 9000)
+    restored.run_due(clock.now + 9000)
+    assert restored_fired == fired
+
+
+def test_restore_drops_timers_past_grace(scheduler, clock, fired):
+    items = [
+        {"carrier": "OLD", "kind": "jump", "due": clock.now - load.FOLLOW_UP_RESTORE_GRACE - 1, "data": {}},
+        {"carrier": "LATE", "kind": "jump", "due": clock.now - load.FOLLOW_UP_RESTORE_GRACE + 1, "data": {}},
+        {"carrier": "SOON", "kind": "lockdown", "due": clock.now + 60, "data": {}},
+        {"carrier": "BROKEN", "kind": "jump"},
+    ]
+    assert scheduler.restore(items) == 2
+    assert scheduler.pending("OLD") == []
+
+    scheduler.run_due()
+    assert fired == [("LATE", "jump", {})]
+    clock.now += 60
+    scheduler.run_due()
+    assert fired[-1] == ("SOON", "lockdown", {})
+
+
+def test_restore_keeps_newer_live_schedule(scheduler, clock, fired):
+    scheduler.schedule("C1", [("jump", clock.now + 600, {"live": True})])
+    scheduler.restore([{"carrier": "C1", "kind": "jump", "due": clock.now + 60, "data": {"live": False}}])
+
+    scheduler.run_due(clock.now + 3600)
+    assert fired == [("C1", "jump", {"live": True})]
+
+
+def test_failing_callback_does_not_stop_the_rest(clock):
+    fired = []
+
+    def callback(carrier, kind, data):
+        if carrier == "BAD":
+            raise RuntimeError("webhook down")
+        fired.append(carrier)
+
+    scheduler = load.FollowUpScheduler(callback, clock=clock)
+    scheduler.schedule("BAD", [("jump", clock.now + 1, {})])
+    scheduler.schedule("GOOD", [("jump", clock.now + 2, {})])
+    assert scheduler.run_due(clock.now + 10) == 2
+    assert fired == ["GOOD"]
+
+
+def test_restore_skips_carriers_cancelled_since_startup(scheduler, clock, fired):
+    scheduler.cancel("C1")
+    scheduler.restore([{"carrier": "C1", "kind": "jump", "due": clock.now + 60, "data": {}}])
+
+    scheduler.run_due(clock.now + 3600)
+    assert fired == []
+
+
+@pytest.mark.parametrize("callsign", ["ABC-123", "Unknown"])
+def test_arrival_cancels_the_scheduled_timers(monkeypatch, callsign):
+    config = type(load.config)({
+        load.CONFIG_FOLLOW_UPS: True,
+        load.CONFIG_WEBHOOK: "https://discord.com/api/webhooks/test",
+        load.CONFIG_CARRIER_NAME: "Test Carrier",
+    })
+    scheduler = load.FollowUpScheduler(lambda *args: None)
+    monkeypatch.setattr(load, "config", config)
+    monkeypatch.setattr(load, "follow_up_scheduler", scheduler)
+    monkeypatch.setattr(load, "get_carrier_state", lambda: (0, 0, callsign))
+    monkeypatch.setattr(load, "is_player_on_their_carrier", lambda state, carrier_id: True)
+    monkeypatch.setattr(load, "deliver", lambda *args, **kwargs: type("Response", (), {"status_code": 204})())
+    monkeypatch.setattr(load, "send_follow_up", lambda *args: True)
+    monkeypatch.setattr(load, "system_coords", lambda system: None)
+    departure = load.datetime.now(load.timezone.utc) + load.timedelta(minutes=15)
+
+    load.journal_entry("Cmdr", False, "Sol", "", {
+        "event": "CarrierJumpRequest", "SystemName": "Alpha Centauri",
+        "DepartureTime": departure.strftime("%Y-%m-%dT%H:%M:%SZ"),
+    }, {})
+    assert len(scheduler) == 2
+
+    load.journal_entry("Cmdr", False, "Alpha Centauri", "", {"event": "CarrierJump", "StarSystem": "Alpha Centauri"}, {})
+    assert len(scheduler) == 0
@@ -0,0 +1,165 @@
+import json
+
+import pytest
+
+import load
+
+
+def jump(departure, carrier="42", destination="Sol", distance=10.0, fuel=7):
+    return {"carrier": carrier, "origin": None, "destination": destination, "distance": distance,
+            "fuel_used": fuel, "requested_at": None, "departure_at": departure}
+
+
+def request(timestamp, departure, system="Sol", carrier_id=42):
+    return {"timestamp": timestamp, "event": "CarrierJumpRequest", "CarrierID": carrier_id,
+            "SystemName": system, "DepartureTime": departure}
+
+
+def cancel(timestamp, carrier_id=42):
+    return {"timestamp": timestamp, "event": "CarrierJumpCancelled", "CarrierID": carrier_id}
+
+
+def star(timestamp, system, pos):
+    return {"timestamp": timestamp, "event": "FSDJump", "StarSystem": system, "StarPos": pos}
+
+
+def stats(timestamp, carrier_id=42, callsign="ABC-123", fuel=800, used=100):
+    return {"timestamp": timestamp, "event": "CarrierStats", "CarrierID": carrier_id, "Callsign": callsign,
+            "FuelLevel": fuel, "SpaceUsage": {"TotalCapacity": 25000, "UsedSpace": used, "FreeSpace": 25000 - used}}
+
+
+def write_journal(directory, name, *events):
+    path = directory / f"Journal.{name}.01.log"
+    path.write_text("".join(json.dumps(e) + "\n" for e in events), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def history(tmp_path, monkeypatch):
+    store = load.JumpHistory(tmp_path / load.HISTORY_FILE)
+    monkeypatch.setattr(load, "jump_history", store)
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def journals(tmp_path):
+    directory = tmp_path / "journals"
+    directory.mkdir()
+    return directory
+
+
+def test_add_many_skips_duplicates(history):
+    jumps = [jump("2026-01-05T10:00:00Z"), jump("2026-01-06T10:00:00Z", distance=20.0)]
+    assert history.add_many(jumps) == 2
+    before = history.digest("42", "2026-W02")
+
+    assert history.add_many(jumps) == 0
+    assert not history.add(jumps[0])
+    assert history.digest("42", "2026-W02") == before
+    assert (before["jumps"], before["distance"], before["fuel"]) == (2, 30.0, 14)
+
+
+def test_digest_splits_weeks(history):
+    history.add_many([
+        jump("2026-01-04T23:00:00Z", distance=5.0),  # Sunday, still week 1
+        jump("2026-01-05T01:00:00Z", distance=7.0),  # Monday, week 2
+        jump("2026-01-11T10:00:00Z", distance=11.0),
+    ])
+
+    first, second = history.digest("42", "2026-W01"), history.digest("42", "2026-W02")
+    assert (first["week_jumps"], first["week_distance"]) == (1, 5.0)
+    assert (second["week_jumps"], second["week_distance"]) == (2, 18.0)
+    assert second["jumps"] == 3 and second["distance"] == 23.0
+    assert history.digest("42", "2026-W03")["week_jumps"] == 0
+    assert history.last_departure("42") == "2026-01-11T10:00:00Z"
+
+
+def test_carriers_are_named_by_id(history):
+    history.add(jump("2026-01-05T10:00:00Z"))
+    history.name_carriers({"42": "ABC-123"})
+
+    assert history.callsign("42") == "ABC-123"
+    assert history.callsign("7") is None
+    assert history.latest_carrier() == "42"
+
+
+def test_parse_journal_file(journals):
+    path = write_journal(
+        journals, "2026-01-01T100000",
+        cancel("2026-01-01T09:59:00Z"),
+        stats("2026-01-01T10:00:00Z"),
+        star("2026-01-01T10:01:00Z", "Sol", [0, 0, 0]),
+        request("2026-01-01T10:02:00Z", "2026-01-01T10:17:00Z", "Alpha Centauri"),
+        request("2026-01-01T10:30:00Z", "2026-01-01T10:45:00Z", "Sol"),
+    )
+    jumps, trailing, cancels, coords, callsigns = load.parse_journal_file(str(path))
+
+    assert [j["entry"]["SystemName"] for j in jumps] == ["Alpha Centauri"]
+    assert trailing["entry"]["SystemName"] == "Sol"
+    assert (trailing["carrier"], trailing["fuel"], trailing["used"]) == ("42", 800, 100)
+    assert cancels == [("2026-01-01T09:59:00Z", "42")]
+    assert coords == {"Sol": (0.0, 0.0, 0.0)}
+    assert callsigns == {"42": "ABC-123"}
+
+
+def test_resolve_cancels_only_before_departure():
+    open_request = {"carrier": "42", "entry": request("2026-01-01T10:00:00Z", "2026-01-01T10:15:00Z")}
+    other_carrier = {"carrier": "7", "entry": request("2026-01-01T10:00:00Z", "2026-01-01T10:15:00Z", carrier_id=7)}
+
+    assert load.resolve_cancels([open_request, other_carrier], [("2026-01-01T10:05:00Z", "42")]) == [other_carrier]
+    # a cancel after departure belongs to some later request
+    assert load.resolve_cancels([open_request], [("2026-01-01T10:20:00Z", "42")]) == [open_request]
+
+
+def test_backfill_cancel_in_next_file(history, journals):
+    write_journal(journals, "2026-01-01T100000",
+                  star("2026-01-01T10:00:00Z", "Sol", [0, 0, 0]),
+                  star("2026-01-01T10:01:00Z", "Alpha Centauri", [3.03, -0.09, 3.16]),
+                  request("2026-01-01T10:02:00Z", "2026-01-01T10:17:00Z", "Alpha Centauri"))
+    write_journal(journals, "2026-01-01T101000",
+                  cancel("2026-01-01T10:10:00Z"),
+                  request("2026-01-01T10:11:00Z", "2026-01-01T10:26:00Z", "Sol"))
+
+    assert load.backfill_history(journals, workers=1) == 1
+    digest = history.digest("42", "2026-W01")
+    assert digest["week_jumps"] == 1
+
+
+def test_backfill_reimport_keeps_totals(history, journals):
+    write_journal(journals, "2026-01-01T100000",
+                  stats("2026-01-01T09:00:00Z"),
+                  star("2026-01-01T09:01:00Z", "Sol", [0, 0, 0]),
+                  star("2026-01-01T09:02:00Z", "Alpha Centauri", [3.03, -0.09, 3.16]),
+                  request("2026-01-01T10:00:00Z", "2026-01-01T10:15:00Z", "Alpha Centauri"),
+                  request("2026-01-08T10:00:00Z", "2026-01-08T10:15:00Z", "Sol"))
+
+    assert load.backfill_history(journals, workers=1) == 2
+    before = history.digest("42", "2026-W02")
+    assert load.backfill_history(journals, workers=1) == 0
+    assert history.digest("42", "2026-W02") == before
+
+    # the second jump starts where the first ended and rolls over into the next week
+    assert (before["week_jumps"], before["jumps"]) == (1, 2)
+    assert before["week_distance"] == pytest.approx(4.378, abs=1e-3)
+    assert history.digest("42", "2026-W01")["week_jumps"] == 1
+    assert history.callsign("42") == "ABC-123"
+
+
+def test_backfill_skips_future_departure(history, journals):
+    write_journal(journals, "2026-01-01T100000", request("2026-01-01T10:00:00Z", "2099-01-01T10:15:00Z"))
+
+    assert load.backfill_history(journals, workers=1) == 0
+    assert history.latest_carrier() is None
+
+
+def test_backfill_and_live_agree_on_used_space(journals):
+    # older journals only give TotalCapacity and FreeSpace
+    event = stats("2026-01-01T10:00:00Z", used=1234)
+    del event["SpaceUsage"]["UsedSpace"]
+    path = write_journal(journals, "2026-01-01T100000", event,
+                         request("2026-01-01T10:02:00Z", "2026-01-01T10:17:00Z"))
+
+    _, trailing, _, _, _ = load.parse_journal_file(str(path))
+    load.update_carrier_state(event)
+    assert trailing["used"] == load.get_carrier_state()[1] == 1234
@@ -0,0 +1,121 @@
+import logging
+
+import pytest
+
+import load
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Counted:
+    """Log argument that counts how often it gets formatted"""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self) -> str:
+        self.formatted += 1
+        return "value"
+
+
+class Capture(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def logged(clock):
+    log = logging.getLogger("fcdn.test.ratelimit")
+    log.propagate = False
+    log.setLevel(logging.DEBUG)
+    log.filters.clear()
+    log.handlers.clear()
+    log.addFilter(load.RateLimitFilter(interval=60.0, burst=3, clock=clock))
+    capture = Capture()
+    log.addHandler(capture)
+    return log, capture
+
+
+def test_burst_passes_then_drops_without_formatting(logged, clock):
+    log, capture = logged
+    args = [Counted() for _ in range(10)]
+    for arg in args:
+        log.warning("Webhook failed: %s", arg)
+        clock.now += 1
+
+    assert capture.messages == ["Webhook failed: value"] * 3
+    assert all(arg.formatted for arg in args[:3])
+    assert not any(arg.formatted for arg in args[3:])
+
+
+def test_suppressed_count_reported_when_window_reopens(logged, clock):
+    log, capture = logged
+    for i in range(8):
+        log.warning("Webhook failed: %s", i)
+
+    clock.now += 60
+    log.warning("Webhook failed: %s", "again")
+    log.warning("Webhook failed: %s", "next")
+
+    assert capture.messages[3:] == ["Webhook failed: again [5 similar suppressed]", "Webhook failed: next"]
+
+
+def test_templates_and_levels_limited_separately(logged):
+    log, capture = logged
+    for _ in range(5):
+        log.warning("one %s", 1)
+        log.warning("two %s", 2)
+        log.error("one %s", 1)
+
+    assert capture.messages.count("one 1") == 6
+    assert capture.messages.count("two 2") == 3
+
+
+def test_flight_recorder_keeps_newest(clock):
+    recorder = load.FlightRecorder(size=3, clock=clock)
+    for i in range(5):
+        recorder.record("jump", n=i)
+        clock.now += 1
+
+    assert len(recorder) == 3
+    assert [fields["n"] for _, _, fields in recorder.events()] == [2, 3, 4]
+
+
+def test_flight_recorder_dump_format(clock):
+    recorder = load.FlightRecorder(clock=clock)
+    clock.now = 1767225600.5  # 2026-01-01 00:00:00.500 UTC
+    recorder.record("webhook", kind="CarrierJumpRequest", status=204, elapsed_ms=12.5)
+    clock.now += 1.25
+    recorder.record("startup")
+
+    assert recorder.dump() == (
+        "2026-01-01 00:00:00.500 webhook kind='CarrierJumpRequest' status=204 elapsed_ms=12.5\n"
+        "2026-01-01 00:00:01.750 startup"
+    )
+
+
+def test_log_event_records_without_formatting_when_disabled(monkeypatch, clock):
+    recorder = load.FlightRecorder(clock=clock)
+    monkeypatch.setattr(load, "flight_recorder", recorder)
+    monkeypatch.setattr(load.logger, "level", logging.INFO)
+    field = Counted()
+
+    load.log_event("carrier_check", carrier="ABC-123", detail=field)
+
+    assert recorder.events() == [(0.0, "carrier_check", {"carrier": "ABC-123", "detail": field})]
+    assert field.formatted == 0
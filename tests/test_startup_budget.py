@@ -0,0 +1,14 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_startup_within_budget():
+    # a fresh interpreter, so modules other tests imported don't hide lazy-import regressions
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys, bench_startup; sys.exit(bench_startup.main())"],
+        capture_output=True, text=True, cwd=ROOT,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr